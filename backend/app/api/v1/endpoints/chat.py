@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from typing import Dict, Any
-import json
 import asyncio
+import orjson
 
 from app.core.logging import get_logger
 from app.services.rag_pipeline import rag_pipeline
@@ -12,6 +12,10 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a server-sent event"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
 @router.post("/query", response_model=ChatResponse)
 async def chat_query(request: ChatRequest):
     """Send a query to the RAG system and get a response"""
@@ -70,7 +74,7 @@ async def chat_stream(request: ChatRequest):
                     "session_id": request.session_id,
                     "top_k": request.top_k
                 }
-                yield f"data: {json.dumps(metadata)}\n\n"
+                yield _sse_event(metadata)
                 
                 # Stream the response
                 async for chunk in rag_pipeline.query_streaming(
@@ -81,7 +85,7 @@ async def chat_stream(request: ChatRequest):
                         "type": "chunk",
                         "content": chunk
                     }
-                    yield f"data: {json.dumps(response_chunk)}\n\n"
+                    yield _sse_event(response_chunk)
                 
                 # Send completion signal
                 completion = {
@@ -89,7 +93,7 @@ async def chat_stream(request: ChatRequest):
                     "status": "completed",
                     "sources": rag_pipeline.get_last_query_sources()
                 }
-                yield f"data: {json.dumps(completion)}\n\n"
+                yield _sse_event(completion)
                 
             except Exception as e:
                 logger.error("Error in streaming response", error=str(e))
@@ -97,7 +101,7 @@ async def chat_stream(request: ChatRequest):
                     "type": "error",
                     "error": str(e)
                 }
-                yield f"data: {json.dumps(error_response)}\n\n"
+                yield _sse_event(error_response)
         
         return StreamingResponse(
             generate_stream(),
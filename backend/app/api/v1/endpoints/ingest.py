@@ -1,6 +1,8 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, Form
 from fastapi.responses import JSONResponse
 from typing import Dict, Any, Optional
+import asyncio
+import orjson
 import os
 import shutil
 from pathlib import Path
@@ -8,12 +10,44 @@ from pathlib import Path
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.services.rag_pipeline import rag_pipeline
-from app.schemas.ingest import IngestResponse, PushDataRequest, PushDataResponse
+from app.schemas.ingest import (
+    IngestResponse, PushDataRequest, PushDataResponse,
+    PushBatchRequest, PushBatchResponse, PushBatchItem
+)
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Bytes read from an upload and written to disk at a time
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+async def _save_upload(file: UploadFile, file_path: Path) -> int:
+    """Write an upload to disk chunk by chunk and return its size
+    
+    Only one chunk is held in memory. Uploads larger than MAX_FILE_SIZE
+    are rejected as soon as the limit is crossed and the partial file is
+    removed.
+    """
+    file_size = 0
+    buffer = await asyncio.to_thread(open, file_path, "wb")
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > settings.MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"File exceeds maximum allowed size {settings.MAX_FILE_SIZE}"
+                )
+            await asyncio.to_thread(buffer.write, chunk)
+    except BaseException:
+        buffer.close()
+        file_path.unlink(missing_ok=True)
+        raise
+    
+    buffer.close()
+    return file_size
+
 @router.post("/upload", response_model=IngestResponse)
 async def upload_file(
     file: UploadFile = File(...),
@@ -33,15 +67,11 @@ async def upload_file(
                 detail=f"File type {file_extension} not supported. Allowed types: {settings.ALLOWED_EXTENSIONS}"
             )
         
-        # Check file size
-        file_size = 0
-        content = await file.read()
-        file_size = len(content)
-        
-        if file_size > settings.MAX_FILE_SIZE:
+        # Reject oversized uploads from the declared size before reading the body
+        if file.size is not None and file.size > settings.MAX_FILE_SIZE:
             raise HTTPException(
-                status_code=400, 
-                detail=f"File size {file_size} exceeds maximum allowed size {settings.MAX_FILE_SIZE}"
+                status_code=400,
+                detail=f"File size {file.size} exceeds maximum allowed size {settings.MAX_FILE_SIZE}"
             )
         
         # Save file to upload directory
@@ -54,9 +84,8 @@ async def upload_file(
             file_path = Path(settings.UPLOAD_DIR) / f"{original_stem}_{counter}{file_extension}"
             counter += 1
         
-        # Write file to disk
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
+        # Stream file to disk, checking its size as it arrives
+        file_size = await _save_upload(file, file_path)
         
         logger.info("File uploaded successfully", 
                    filename=file.filename,
@@ -67,9 +96,8 @@ async def upload_file(
         file_metadata = {}
         if metadata:
             try:
-                import json
-                file_metadata = json.loads(metadata)
-            except json.JSONDecodeError:
+                file_metadata = orjson.loads(metadata)
+            except orjson.JSONDecodeError:
                 logger.warning("Invalid metadata JSON provided", metadata=metadata)
         
         # Add upload metadata
@@ -113,7 +141,7 @@ async def push_data(request: PushDataRequest):
             raise HTTPException(status_code=400, detail="Content cannot be empty")
         
         # Prepare metadata
-        metadata = request.metadata or {}
+        metadata = request.metadata
         metadata.update({
             "source_tool": request.source_tool,
             "content_length": len(request.content)
@@ -147,6 +175,49 @@ async def push_data(request: PushDataRequest):
                     error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to process data: {str(e)}")
 
+@router.post("/push/batch", response_model=PushBatchResponse)
+async def push_data_batch(request: PushBatchRequest):
+    """Push many items from other tools in one request, embedding them in shared batches"""
+    try:
+        # Validate request
+        if not request.items:
+            raise HTTPException(status_code=400, detail="No items provided")
+        if any(not item.content.strip() for item in request.items):
+            raise HTTPException(status_code=400, detail="Content cannot be empty")
+        
+        # Prepare metadata
+        texts = []
+        metadatas = []
+        for item in request.items:
+            metadata = item.metadata
+            metadata.update({
+                "source_tool": item.source_tool,
+                "content_length": len(item.content)
+            })
+            texts.append(item.content)
+            metadatas.append(metadata)
+        
+        logger.info("Processing batch push data request", 
+                   items=len(texts),
+                   content_length=sum(len(text) for text in texts))
+        
+        # Ingest texts using RAG pipeline
+        results = await rag_pipeline.ingest_texts(texts=texts, metadatas=metadatas)
+        
+        return PushBatchResponse(
+            success=True,
+            message=f"{len(results)} items ingested successfully",
+            documents=[PushBatchItem(**result) for result in results]
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to push data batch", 
+                    items=len(request.items),
+                    error=str(e))
+        raise HTTPException(status_code=500, detail=f"Failed to process data: {str(e)}")
+
 @router.get("/status/{document_id}")
 async def get_ingestion_status(document_id: int):
     """Get the ingestion status of a document"""
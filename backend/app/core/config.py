@@ -19,8 +19,17 @@ class Settings(BaseSettings):
     # Qdrant settings
     QDRANT_HOST: str = Field(default="localhost", env="QDRANT_HOST")
     QDRANT_PORT: int = Field(default=6333, env="QDRANT_PORT")
+    QDRANT_GRPC_PORT: int = Field(default=6334, env="QDRANT_GRPC_PORT")
+    QDRANT_PREFER_GRPC: bool = Field(default=True, env="QDRANT_PREFER_GRPC")
+    QDRANT_POOL_SIZE: int = Field(default=100, env="QDRANT_POOL_SIZE")
     QDRANT_COLLECTION_NAME: str = Field(default="knowledge_lake", env="QDRANT_COLLECTION_NAME")
     QDRANT_API_KEY: Optional[str] = Field(default=None, env="QDRANT_API_KEY")
+    QDRANT_HTTPS: Optional[bool] = Field(default=None, env="QDRANT_HTTPS")  # None: HTTPS when an API key is set
+    QDRANT_QUANTIZATION: str = Field(default="auto", env="QDRANT_QUANTIZATION")  # auto, scalar, binary, none
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = Field(default=2.0, env="QDRANT_QUANTIZATION_OVERSAMPLING")
+    QDRANT_HNSW_M: int = Field(default=16, env="QDRANT_HNSW_M")
+    QDRANT_HNSW_EF_CONSTRUCT: int = Field(default=200, env="QDRANT_HNSW_EF_CONSTRUCT")
+    QDRANT_HNSW_EF: int = Field(default=128, env="QDRANT_HNSW_EF")  # search-time ef
     
     # AWS Bedrock settings
     AWS_ACCESS_KEY_ID: Optional[str] = Field(default=None, env="AWS_ACCESS_KEY_ID")
@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Boolean, JSON
+from sqlalchemy import create_engine, insert, Column, Integer, String, DateTime, Text, Boolean, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from datetime import datetime
+from typing import List, Dict, Any
 import os
 
 from app.core.config import settings
@@ -99,6 +100,11 @@ def get_db() -> Session:
     finally:
         db.close()
 
+def bulk_insert(db: Session, model, rows: List[Dict[str, Any]], batch_size: int = 500):
+    """Insert many rows with executemany batches instead of one ORM add per row"""
+    for i in range(0, len(rows), batch_size):
+        db.execute(insert(model), rows[i:i + batch_size])
+
 def init_db():
     """Initialize database"""
     logger.info("Initializing database", database_url=settings.DATABASE_URL)
@@ -0,0 +1,28 @@
+from typing import Iterable, List, Tuple
+from base64 import urlsafe_b64encode
+import hashlib
+
+# 128-bit BLAKE2b digests: faster than SHA-256 without SHA-NI and ample for dedup
+DIGEST_SIZE = 16
+
+def _encode_digest(digest: bytes) -> str:
+    """Encode a raw digest as unpadded base64url (22 chars for 16 bytes)"""
+    return urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+def content_hashes(texts: Iterable[str]) -> List[str]:
+    """Get the BLAKE2b digest of each text's UTF-8 encoding"""
+    # Bind the constructor locally to skip the module lookup per text
+    _blake2b = hashlib.blake2b
+    return [
+        _encode_digest(_blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).digest())
+        for text in texts
+    ]
+
+def content_digest(text: str) -> Tuple[str, int]:
+    """Get a text's BLAKE2b digest and UTF-8 byte length from one encode"""
+    data = text.encode("utf-8")
+    return _encode_digest(hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()), len(data)
+
+def content_digests(texts: Iterable[str]) -> List[Tuple[str, int]]:
+    """Get the BLAKE2b digest and UTF-8 byte length of each text"""
+    return [content_digest(text) for text in texts]
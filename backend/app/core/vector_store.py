@@ -1,36 +1,127 @@
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Set
+from qdrant_client import QdrantClient, AsyncQdrantClient
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue, MatchAny, OptimizersConfigDiff,
+    PayloadSchemaType, SearchRequest, PayloadSelectorInclude, ScalarQuantization,
+    ScalarQuantizationConfig, ScalarType, BinaryQuantization, BinaryQuantizationConfig,
+    SearchParams, QuantizationSearchParams, HnswConfigDiff
+)
 from qdrant_client.http.exceptions import UnexpectedResponse
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
+import threading
+import time
 import uuid
-import hashlib
+import httpx
+import numpy as np
 
 from app.core.config import settings
+from app.core.hashing import content_hashes
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Points per concurrent upsert request in aadd_vectors
+UPSERT_BATCH_SIZE = 64
+
+# Recently stored (document_id, content_hash) pairs whose vector IDs are kept in
+# memory; older content is looked up through the content_hash payload index
+RECENT_HASHES_SIZE = 10_000
+
+# Seconds that collection info and health results are reused
+STATUS_CACHE_TTL = 5.0
+
+# Minimum dimension at which "auto" quantization picks binary over scalar
+BINARY_QUANTIZATION_MIN_DIMENSION = 1024
+
+@lru_cache(maxsize=512)
+def _build_cached_filter(frozen_items: Tuple[Tuple[str, Any], ...]) -> Filter:
+    """Build a match-all filter once per distinct set of conditions"""
+    return _build_filter_uncached(frozen_items)
+
+def _build_filter_uncached(items) -> Filter:
+    """Build a filter requiring every key to match its value"""
+    return Filter(must=[
+        FieldCondition(key=key, match=MatchValue(value=value))
+        for key, value in items
+    ])
+
+def build_filter(filter_conditions: Dict[str, Any]) -> Filter:
+    """Get the Qdrant filter for filter_conditions, cached for hashable values"""
+    items = tuple(sorted(filter_conditions.items()))
+    try:
+        return _build_cached_filter(items)
+    except TypeError:
+        # Unhashable values can't be cache keys
+        return _build_filter_uncached(items)
+
 class QdrantVectorStore:
     """Qdrant vector store wrapper for RAG operations"""
     
+    # Payload fields returned with search hits besides the text itself
+    _payload_whitelist = ["document_id", "source", "source_tool", "chunk_index"]
+    
+    # Payload fields used in dedup lookups and filters
+    _payload_indexes = {
+        "content_hash": PayloadSchemaType.KEYWORD,
+        "source_tool": PayloadSchemaType.KEYWORD,
+        "document_id": PayloadSchemaType.INTEGER
+    }
+    
     def __init__(self):
         self.client = None
+        self.async_client = None
         self.collection_name = settings.QDRANT_COLLECTION_NAME
         self.dimension = settings.EMBEDDING_DIMENSION
+        self.quantization = self._resolve_quantization()
+        self._search_params = self._build_search_params()
+        # (document_id, content_hash) -> vector ID of recently stored content, in least
+        # recently used order; points are never shared between documents
+        self._recent_hashes: "OrderedDict[Tuple[Any, str], str]" = OrderedDict()
+        self._recent_hashes_lock = threading.Lock()
+        self._status_cache: Dict[str, Tuple[float, Any]] = {}
         self._initialize_client()
     
+    def _create_clients(self):
+        """Create the sync and async Qdrant clients sharing one connection config"""
+        # Same default as qdrant-client: TLS whenever an API key is configured
+        https = settings.QDRANT_HTTPS
+        if https is None:
+            https = settings.QDRANT_API_KEY is not None
+        
+        client_kwargs = dict(
+            host=settings.QDRANT_HOST,
+            port=settings.QDRANT_PORT,
+            grpc_port=settings.QDRANT_GRPC_PORT,
+            prefer_grpc=settings.QDRANT_PREFER_GRPC,
+            https=https,
+            api_key=settings.QDRANT_API_KEY,
+            timeout=60,
+            # Pool for the calls that still go over REST
+            limits=httpx.Limits(
+                max_connections=settings.QDRANT_POOL_SIZE,
+                max_keepalive_connections=settings.QDRANT_POOL_SIZE
+            )
+        )
+        self.client = QdrantClient(**client_kwargs)
+        self.async_client = AsyncQdrantClient(**client_kwargs)
+        # Keep-alive connection for the REST readiness probe
+        self.http_client = httpx.Client(
+            base_url=f"{'https' if https else 'http'}://{settings.QDRANT_HOST}:{settings.QDRANT_PORT}",
+            headers={"api-key": settings.QDRANT_API_KEY} if settings.QDRANT_API_KEY else None,
+            timeout=1
+        )
+    
     def _initialize_client(self):
         """Initialize Qdrant client"""
         try:
-            self.client = QdrantClient(
-                host=settings.QDRANT_HOST,
-                port=settings.QDRANT_PORT,
-                api_key=settings.QDRANT_API_KEY,
-                timeout=60
-            )
+            self._create_clients()
             logger.info("Qdrant client initialized", 
                        host=settings.QDRANT_HOST, 
-                       port=settings.QDRANT_PORT)
+                       port=settings.QDRANT_PORT,
+                       grpc_port=settings.QDRANT_GRPC_PORT,
+                       prefer_grpc=settings.QDRANT_PREFER_GRPC)
             
             # Ensure collection exists
             self._ensure_collection()
@@ -39,6 +130,38 @@ class QdrantVectorStore:
             logger.error("Failed to initialize Qdrant client", error=str(e))
             raise
     
+    def _resolve_quantization(self) -> str:
+        """Resolve the configured quantization mode for this collection"""
+        quantization = settings.QDRANT_QUANTIZATION.lower()
+        if quantization == "auto":
+            # Binary quantization only keeps enough recall for high-dimensional cosine vectors
+            return "binary" if self.dimension >= BINARY_QUANTIZATION_MIN_DIMENSION else "scalar"
+        return quantization
+    
+    def _build_quantization_config(self):
+        """Build the quantization config used when creating the collection"""
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+    
+    def _build_search_params(self, hnsw_ef: Optional[int] = None) -> SearchParams:
+        """Build search params; quantized candidates are rescored with the original vectors"""
+        quantization_params = None
+        if self.quantization in ("scalar", "binary"):
+            quantization_params = QuantizationSearchParams(
+                ignore=False,
+                rescore=True,
+                oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING
+            )
+        return SearchParams(
+            hnsw_ef=hnsw_ef or settings.QDRANT_HNSW_EF,
+            quantization=quantization_params
+        )
+    
     def _ensure_collection(self):
         """Ensure the collection exists, create if it doesn't"""
         try:
@@ -53,51 +176,241 @@ class QdrantVectorStore:
                     vectors_config=VectorParams(
                         size=self.dimension,
                         distance=Distance.COSINE
-                    )
+                    ),
+                    hnsw_config=HnswConfigDiff(
+                        m=settings.QDRANT_HNSW_M,
+                        ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+                        full_scan_threshold=10000,
+                        on_disk=False
+                    ),
+                    optimizers_config=OptimizersConfigDiff(memmap_threshold=200000),
+                    quantization_config=self._build_quantization_config()
                 )
-                logger.info("Collection created successfully", collection_name=self.collection_name)
+                logger.info("Collection created successfully", 
+                           collection_name=self.collection_name,
+                           quantization=self.quantization)
             else:
                 logger.info("Collection already exists", collection_name=self.collection_name)
+            
+            # Index filtered payload fields so lookups and deletes avoid a full scan
+            for field_name, field_schema in self._payload_indexes.items():
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema
+                )
                 
         except Exception as e:
             logger.error("Failed to ensure collection", error=str(e))
             raise
     
-    def add_vectors(self, texts: List[str], vectors: List[List[float]], 
-                   metadatas: List[Dict[str, Any]]) -> List[str]:
-        """Add vectors to the collection"""
+    def _scroll_by_hashes(self, hashes: Set[str], document_id: Any = None,
+                          with_vectors: bool = False) -> Dict[str, Any]:
+        """Find one stored point per content hash through the payload indexes
+        
+        Only points of document_id are considered when it is given. Paging
+        stops as soon as every hash has been found, so content shared by many
+        documents does not pull all of its copies.
+        """
+        conditions = []
+        if document_id is not None:
+            conditions.append(FieldCondition(key="document_id", match=MatchValue(value=document_id)))
+        
+        found = {}
+        pending = set(hashes)
+        offset = None
+        while pending:
+            records, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=Filter(must=[
+                    *conditions,
+                    FieldCondition(key="content_hash", match=MatchAny(any=list(pending)))
+                ]),
+                limit=len(pending),
+                offset=offset,
+                with_payload=["content_hash"],
+                with_vectors=with_vectors
+            )
+            for record in records:
+                content_hash = (record.payload or {}).get("content_hash")
+                if content_hash in pending:
+                    found[content_hash] = record
+                    pending.discard(content_hash)
+            if offset is None:
+                break
+        
+        return found
+    
+    def _find_stored(self, keys: Iterable[Tuple[Any, str]]) -> Dict[Tuple[Any, str], str]:
+        """Look up vector IDs of (document_id, content_hash) pairs already stored
+        
+        Recently stored pairs are answered from memory; the rest are looked
+        up in Qdrant, one filtered scroll per document.
+        """
+        found = {}
+        missing: Dict[Any, Set[str]] = {}
+        with self._recent_hashes_lock:
+            for key in keys:
+                vector_id = self._recent_hashes.get(key)
+                if vector_id is None:
+                    missing.setdefault(key[0], set()).add(key[1])
+                else:
+                    self._recent_hashes.move_to_end(key)
+                    found[key] = vector_id
+        
+        stored = {}
+        for document_id, hashes in missing.items():
+            # Points written without a document_id can't be filtered on it
+            if document_id is None:
+                continue
+            for content_hash, record in self._scroll_by_hashes(hashes, document_id).items():
+                stored[(document_id, content_hash)] = str(record.id)
+        
+        self._remember_hashes(stored)
+        found.update(stored)
+        return found
+    
+    def _remember_hashes(self, vector_ids: Dict[Tuple[Any, str], str]):
+        """Record where (document_id, content_hash) pairs are stored, evicting the oldest"""
+        with self._recent_hashes_lock:
+            for key, vector_id in vector_ids.items():
+                self._recent_hashes[key] = vector_id
+                self._recent_hashes.move_to_end(key)
+            while len(self._recent_hashes) > RECENT_HASHES_SIZE:
+                self._recent_hashes.popitem(last=False)
+    
+    def _forget_hashes(self, vector_ids: Optional[List[str]] = None):
+        """Drop deleted vectors from the recent hash cache, or clear it entirely"""
+        with self._recent_hashes_lock:
+            if vector_ids is None:
+                self._recent_hashes.clear()
+                return
+            
+            deleted = set(map(str, vector_ids))
+            for key in [key for key, vector_id in self._recent_hashes.items() if vector_id in deleted]:
+                del self._recent_hashes[key]
+    
+    def _forget_documents(self, document_ids: List[int]):
+        """Drop every remembered pair of the given documents"""
+        deleted = set(document_ids)
+        with self._recent_hashes_lock:
+            for key in [key for key in self._recent_hashes if key[0] in deleted]:
+                del self._recent_hashes[key]
+    
+    def stored_vectors(self, hashes: List[Optional[str]]) -> Dict[int, List[float]]:
+        """Fetch the stored vectors of already indexed content, so callers can skip embedding it
+        
+        Returns position -> vector for every hash whose content is stored in
+        any document; content deleted in the meantime is simply missing and
+        must be embedded.
+        """
+        wanted = {content_hash for content_hash in hashes if content_hash}
+        if not wanted:
+            return {}
+        
+        vectors = {
+            content_hash: record.vector
+            for content_hash, record in self._scroll_by_hashes(wanted, with_vectors=True).items()
+            if record.vector is not None
+        }
+        return {i: vectors[content_hash] for i, content_hash in enumerate(hashes) if content_hash in vectors}
+    
+    def _content_hashes(self, texts: List[str], metadatas: List[Dict[str, Any]]) -> List[str]:
+        """Get content hashes, reusing the chunk_hash chunkers already computed"""
+        if all(metadata.get("chunk_hash") for metadata in metadatas):
+            return [metadata["chunk_hash"] for metadata in metadatas]
+        return content_hashes(texts)
+    
+    def _assign_vector_ids(self, document_ids: List[Any], 
+                           hashes: List[str]) -> Tuple[List[str], List[int], Dict[Tuple[Any, str], str]]:
+        """Reuse IDs of content the same document already stored and generate IDs for the rest
+        
+        Deduplication is scoped per document so every point carries the
+        document_id it belongs to. Returns the ID for every hash, the indices
+        that still need uploading and the newly assigned
+        (document_id, hash) -> ID pairs.
+        """
+        keys = list(zip(document_ids, hashes))
+        vector_ids = []
+        new_indices = []
+        assigned = {}
+        known_id = self._find_stored(set(keys)).get
+        new_id = uuid.uuid4
+        
+        for i, key in enumerate(keys):
+            vector_id = known_id(key) or assigned.get(key)
+            if vector_id is None:
+                vector_id = str(new_id())
+                assigned[key] = vector_id
+                new_indices.append(i)
+            vector_ids.append(vector_id)
+        
+        return vector_ids, new_indices, assigned
+    
+    def _build_payloads(self, texts: List[str], hashes: List[str], 
+                        metadatas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build point payloads with text, content hash and metadata"""
+        return [
+            {"text": text, "content_hash": content_hash} | metadata
+            for text, content_hash, metadata in zip(texts, hashes, metadatas)
+        ]
+    
+    def _build_points(self, texts: List[str], vectors: np.ndarray, 
+                      metadatas: List[Dict[str, Any]]) -> Tuple[List[str], List[PointStruct], Dict[Tuple[Any, str], str]]:
+        """Build points for content its document has not stored yet
+        
+        Returns the ID for every text, the points to upload and the newly
+        assigned (document_id, hash) -> ID pairs.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        hashes = self._content_hashes(texts, metadatas)
+        document_ids = [metadata.get("document_id") for metadata in metadatas]
+        vector_ids, new_indices, assigned = self._assign_vector_ids(document_ids, hashes)
+        
+        payloads = self._build_payloads(
+            [texts[i] for i in new_indices],
+            [hashes[i] for i in new_indices],
+            [metadatas[i] for i in new_indices]
+        )
+        _PS = PointStruct
+        new_ids = [vector_ids[i] for i in new_indices]
+        points = [
+            _PS(id=vector_id, vector=vector, payload=payload)
+            for vector_id, vector, payload in zip(new_ids, vectors[new_indices].tolist(), payloads)
+        ]
+        
+        return vector_ids, points, assigned
+    
+    async def aadd_vectors(self, texts: List[str], vectors: np.ndarray, 
+                          metadatas: List[Dict[str, Any]]) -> List[str]:
+        """Add vectors to the collection using concurrent batched upserts
+        
+        Content the same document already stored is not uploaded again; its
+        existing vector ID is returned instead.
+        """
         try:
-            points = []
-            vector_ids = []
+            # Hashing and pydantic point validation are CPU-bound; keep them
+            # off the event loop so only the network calls run on it
+            vector_ids, points, assigned = await asyncio.to_thread(
+                self._build_points, texts, vectors, metadatas
+            )
             
-            for i, (text, vector, metadata) in enumerate(zip(texts, vectors, metadatas)):
-                # Generate unique ID for the vector
-                vector_id = str(uuid.uuid4())
-                vector_ids.append(vector_id)
-                
-                # Create payload with text and metadata
-                payload = {
-                    "text": text,
-                    "content_hash": hashlib.sha256(text.encode()).hexdigest(),
-                    **metadata
-                }
-                
-                # Create point
-                point = PointStruct(
-                    id=vector_id,
-                    vector=vector,
-                    payload=payload
+            # Upload batches concurrently; the server pipelines the writes
+            await asyncio.gather(*[
+                self.async_client.upsert(
+                    collection_name=self.collection_name,
+                    points=points[i:i + UPSERT_BATCH_SIZE],
+                    wait=False
                 )
-                points.append(point)
+                for i in range(0, len(points), UPSERT_BATCH_SIZE)
+            ])
             
-            # Upload points
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
-            )
+            self._remember_hashes(assigned)
             
             logger.info("Added vectors to collection", 
                        count=len(points), 
+                       duplicates=len(texts) - len(points),
+                       batches=(len(points) + UPSERT_BATCH_SIZE - 1) // UPSERT_BATCH_SIZE,
                        collection_name=self.collection_name)
             
             return vector_ids
@@ -107,42 +420,68 @@ class QdrantVectorStore:
             raise
     
     def search_vectors(self, query_vector: List[float], top_k: int = 5, 
-                      filter_conditions: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                      filter_conditions: Optional[Dict[str, Any]] = None,
+                      search_fields: Optional[List[str]] = None,
+                      hnsw_ef: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search for similar vectors"""
+        return self.search_vectors_batch([query_vector], top_k, filter_conditions, search_fields, hnsw_ef)[0]
+    
+    def search_vectors_batch(self, query_vectors: List[List[float]], top_k: int = 5, 
+                            filter_conditions: Optional[Dict[str, Any]] = None,
+                            search_fields: Optional[List[str]] = None,
+                            hnsw_ef: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """Search for similar vectors for several queries in one request
+        
+        Only the text and whitelisted metadata fields are returned; pass
+        search_fields to request additional payload fields. hnsw_ef trades
+        latency for recall per query (defaults to QDRANT_HNSW_EF).
+        """
         try:
-            # Build filter if provided
-            search_filter = None
-            if filter_conditions:
-                filter_conditions_list = []
-                for key, value in filter_conditions.items():
-                    filter_conditions_list.append(
-                        FieldCondition(key=key, match=MatchValue(value=value))
-                    )
-                search_filter = Filter(must=filter_conditions_list)
-            
-            # Perform search
-            search_result = self.client.search(
+            # Build filter if provided, shared by every query
+            search_filter = build_filter(filter_conditions) if filter_conditions else None
+            
+            # Only ship the payload fields callers actually read
+            payload_selector = PayloadSelectorInclude(
+                include=["text", *self._payload_whitelist, *(search_fields or [])]
+            )
+            
+            search_params = self._search_params if hnsw_ef is None else self._build_search_params(hnsw_ef)
+            
+            requests = [
+                SearchRequest(
+                    vector=query_vector,
+                    limit=top_k,
+                    filter=search_filter,
+                    params=search_params,
+                    with_payload=payload_selector,
+                    with_vector=False
+                )
+                for query_vector in query_vectors
+            ]
+            
+            # Perform all searches in a single round trip
+            batch_result = self.client.search_batch(
                 collection_name=self.collection_name,
-                query_vector=query_vector,
-                limit=top_k,
-                query_filter=search_filter,
-                with_payload=True,
-                with_vectors=False
+                requests=requests
             )
             
             # Format results
-            results = []
-            for hit in search_result:
-                result = {
-                    "id": hit.id,
-                    "score": hit.score,
-                    "text": hit.payload.get("text", ""),
-                    "metadata": {k: v for k, v in hit.payload.items() if k not in ["text", "content_hash"]}
-                }
-                results.append(result)
+            results = [
+                [
+                    {
+                        "id": hit.id,
+                        "score": hit.score,
+                        "text": hit.payload.get("text", ""),
+                        "metadata": {k: v for k, v in hit.payload.items() if k != "text"}
+                    }
+                    for hit in search_result
+                ]
+                for search_result in batch_result
+            ]
             
             logger.info("Search completed", 
-                       query_results=len(results), 
+                       queries=len(query_vectors),
+                       query_results=sum(len(r) for r in results), 
                        top_k=top_k)
             
             return results
@@ -158,6 +497,7 @@ class QdrantVectorStore:
                 collection_name=self.collection_name,
                 points_selector=vector_ids
             )
+            self._forget_hashes(vector_ids)
             
             logger.info("Deleted vectors", count=len(vector_ids))
             return True
@@ -169,18 +509,14 @@ class QdrantVectorStore:
     def delete_by_filter(self, filter_conditions: Dict[str, Any]) -> bool:
         """Delete vectors by filter conditions"""
         try:
-            filter_conditions_list = []
-            for key, value in filter_conditions.items():
-                filter_conditions_list.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
-            
-            delete_filter = Filter(must=filter_conditions_list)
+            delete_filter = build_filter(filter_conditions)
             
             self.client.delete(
                 collection_name=self.collection_name,
                 points_selector=delete_filter
             )
+            # The deleted IDs are unknown here, so drop every remembered pair
+            self._forget_hashes()
             
             logger.info("Deleted vectors by filter", filter_conditions=filter_conditions)
             return True
@@ -189,29 +525,77 @@ class QdrantVectorStore:
             logger.error("Failed to delete vectors by filter", error=str(e))
             return False
     
+    def delete_document_vectors(self, document_ids: List[int]) -> bool:
+        """Delete every vector stored for the given documents"""
+        try:
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=Filter(must=[
+                    FieldCondition(key="document_id", match=MatchAny(any=list(document_ids)))
+                ])
+            )
+            self._forget_documents(document_ids)
+            
+            logger.info("Deleted document vectors", document_ids=list(document_ids))
+            return True
+            
+        except Exception as e:
+            logger.error("Failed to delete document vectors", error=str(e))
+            return False
+    
+    def _cached_status(self, key: str) -> Optional[Any]:
+        """Get a cached status result if it is younger than STATUS_CACHE_TTL"""
+        cached = self._status_cache.get(key)
+        if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        return None
+    
     def get_collection_info(self) -> Dict[str, Any]:
-        """Get collection information"""
+        """Get collection information, reused for a few seconds between calls"""
+        cached = self._cached_status("collection_info")
+        if cached is not None:
+            return cached
+        
         try:
             collection_info = self.client.get_collection(self.collection_name)
-            return {
+            info = {
                 "name": collection_info.config.collection_name,
                 "vector_size": collection_info.config.params.vectors.size,
                 "distance": collection_info.config.params.vectors.distance,
                 "points_count": collection_info.points_count,
                 "status": collection_info.status
             }
+            self._status_cache["collection_info"] = (time.monotonic(), info)
+            return info
         except Exception as e:
             logger.error("Failed to get collection info", error=str(e))
             return {}
     
     def health_check(self) -> bool:
-        """Check if Qdrant is healthy"""
+        """Check if Qdrant is ready using its lightweight readiness probe"""
+        cached = self._cached_status("health")
+        if cached is not None:
+            return cached
+        
         try:
-            collections = self.client.get_collections()
-            return True
+            response = self.http_client.get("/readyz")
+            healthy = response.is_success
         except Exception as e:
             logger.error("Qdrant health check failed", error=str(e))
-            return False
+            healthy = False
+        
+        self._status_cache["health"] = (time.monotonic(), healthy)
+        return healthy
+
+    def warm_up(self):
+        """Open the probe connection before the first request"""
+        self.health_check()
+    
+    async def aclose(self):
+        """Close the Qdrant clients and the readiness probe connection"""
+        await self.async_client.close()
+        self.client.close()
+        self.http_client.close()
 
 # Global instance
 vector_store = QdrantVectorStore() 
\ No newline at end of file
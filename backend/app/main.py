@@ -1,13 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, ORJSONResponse
 import uvicorn
+import asyncio
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.api.v1.api import api_router
 from app.core.database import init_db
+from app.core.vector_store import vector_store
+from app.services.chunkers import chunker_manager
 
 # Setup logging
 setup_logging()
@@ -16,15 +19,19 @@ setup_logging()
 async def lifespan(app: FastAPI):
     # Startup
     init_db()
+    # Pay Qdrant connection setup now rather than on the first upload
+    await asyncio.to_thread(vector_store.warm_up)
     yield
-    # Shutdown - cleanup if needed
-    pass
+    # Shutdown - don't let queued chunking work hold up exit
+    chunker_manager.shutdown()
+    await vector_store.aclose()
 
 app = FastAPI(
     title="RAG System API",
     description="Internal RAG System / Personal Knowledge Lake",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Set up CORS middleware
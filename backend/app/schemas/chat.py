@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
 
 class ChatRequest(BaseModel):
     """Request model for chat queries"""
@@ -7,20 +7,30 @@ class ChatRequest(BaseModel):
     top_k: int = Field(default=5, description="Number of relevant chunks to retrieve")
     session_id: Optional[str] = Field(None, description="Chat session ID")
 
+class SourceInfo(BaseModel):
+    """Source document referenced by a chat response"""
+    model_config = ConfigDict(frozen=True)
+    
+    document_id: int
+    filename: str
+    source_tool: str
+    chunk_index: int = 0
+    relevance_score: float = 0.0
+
 class ChatResponse(BaseModel):
     """Response model for chat queries"""
     success: bool
     response: str
     query: str
     session_id: Optional[str] = None
-    sources: List[Dict[str, Any]] = Field(default_factory=list, description="Source documents used")
+    sources: List[SourceInfo] = Field(default_factory=list, description="Source documents used")
 
 class ChatMessage(BaseModel):
     """Individual chat message model"""
     role: str = Field(..., description="Message role: user, assistant, system")
     content: str = Field(..., description="Message content")
     timestamp: str = Field(..., description="Message timestamp")
-    sources: Optional[List[Dict[str, Any]]] = Field(None, description="Source documents")
+    sources: Optional[List[SourceInfo]] = Field(None, description="Source documents")
 
 class ChatSession(BaseModel):
     """Chat session model"""
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 class IngestResponse(BaseModel):
@@ -16,7 +16,13 @@ class PushDataRequest(BaseModel):
     """Request model for pushing data from other tools"""
     source_tool: str = Field(..., description="Name of the source tool")
     content: str = Field(..., description="Text content to be ingested")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    
+    @field_validator("metadata", mode="before")
+    @classmethod
+    def _null_metadata_as_empty(cls, value):
+        """Accept an explicit null from older clients as empty metadata"""
+        return {} if value is None else value
 
 class PushDataResponse(BaseModel):
     """Response model for data push"""
@@ -28,6 +34,24 @@ class PushDataResponse(BaseModel):
     chunk_count: int
     processing_time: float
 
+class PushBatchRequest(BaseModel):
+    """Request model for pushing many items from other tools at once"""
+    items: List[PushDataRequest] = Field(..., description="Items to be ingested")
+
+class PushBatchItem(BaseModel):
+    """Result for one item of a batch push"""
+    document_id: int
+    filename: str
+    status: str
+    chunk_count: int
+    processing_time: float
+
+class PushBatchResponse(BaseModel):
+    """Response model for batch data push"""
+    success: bool
+    message: str
+    documents: List[PushBatchItem]
+
 class DocumentStatus(BaseModel):
     """Document status model"""
     document_id: int
@@ -1,22 +1,58 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
+import itertools
+import multiprocessing
+import os
+import re
+import threading
 
 from langchain_text_splitters import (
     RecursiveCharacterTextSplitter,
-    CharacterTextSplitter,
-    TokenTextSplitter
+    CharacterTextSplitter
 )
 from langchain_core.documents import Document
+import tiktoken
 
 from app.core.config import settings
+from app.core.hashing import content_digest, content_digests
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Documents smaller than this are chunked in-process; pickling them to a
+# worker costs more than splitting them
+PARALLEL_MIN_DOCUMENT_SIZE = 10_000
+
+# Texts whose chunk offsets each RecursiveCharacterChunker remembers
+OFFSET_CACHE_SIZE = 1024
+
+# Guards the offset caches, which ingestion worker threads update concurrently
+_offset_cache_lock = threading.Lock()
+
+# Chunker used by the current worker process, set by the pool initializer
+_worker_chunker = None
+
+# Guards creating and shutting down chunker process pools across threads
+_pool_lock = threading.Lock()
+
+def _init_worker(chunker: "BaseTextChunker"):
+    """Install the chunker a pool worker splits documents with"""
+    global _worker_chunker
+    _worker_chunker = chunker
+
+def _chunk_in_worker(document: Document) -> List[Document]:
+    """Chunk a single document in a pool worker"""
+    return _worker_chunker.chunk_documents([document])
+
 class BaseTextChunker(ABC):
     """Base class for text chunkers"""
     
+    _pool: Optional[ProcessPoolExecutor] = None
+    _pool_workers = 0
+    
     @abstractmethod
     def chunk_documents(self, documents: List[Document]) -> List[Document]:
         """Chunk documents into smaller pieces"""
@@ -26,37 +62,264 @@ class BaseTextChunker(ABC):
     def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Chunk text into smaller pieces"""
         pass
+    
+    def iter_chunks(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Iterator[Document]:
+        """Yield chunks of text; chunkers that can split lazily override this"""
+        yield from self.chunk_documents([Document(page_content=text, metadata=metadata or {})])
+    
+    def _make_chunks(self, pieces: Iterable[str], metadata: Optional[Dict[str, Any]],
+                     chunker_metadata: Dict[str, Any]) -> Iterator[Document]:
+        """Wrap split text in Documents carrying their final chunk metadata"""
+        metadata = metadata or {}
+        for i, piece in enumerate(pieces):
+            chunk_hash, chunk_bytes = content_digest(piece)
+            yield Document(
+                page_content=piece,
+                metadata={**metadata, **chunker_metadata, "chunk_id": i, 
+                          "chunk_hash": chunk_hash, "chunk_bytes": chunk_bytes}
+            )
+    
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Get this chunker's process pool, creating it on first use"""
+        # Concurrent ingests must not each start a pool and leak all but one
+        with _pool_lock:
+            if self._pool is None or self._pool_workers != workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                # Workers receive this chunker once, at startup, not per document.
+                # The pool is created from worker threads, so children come from a
+                # forkserver rather than a fork of this multi-threaded process
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                    initializer=_init_worker,
+                    initargs=(self,)
+                )
+                self._pool_workers = workers
+            return self._pool
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the chunker for pool workers, leaving the pool itself behind"""
+        state = self.__dict__.copy()
+        state.pop("_pool", None)
+        state.pop("_pool_workers", None)
+        return state
+    
+    def shutdown_pool(self):
+        """Stop this chunker's worker processes without waiting on queued documents"""
+        with _pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+                self._pool_workers = 0
+    
+    def chunk_documents_parallel(self, documents: List[Document], workers: Optional[int] = None) -> List[Document]:
+        """Chunk documents across worker processes
+        
+        Large documents are split in the process pool, small ones in-process.
+        Chunks keep document order and chunk_id is numbered across the batch
+        as chunk_documents does.
+        """
+        large_indices = [
+            i for i, doc in enumerate(documents)
+            if len(doc.page_content) >= PARALLEL_MIN_DOCUMENT_SIZE
+        ]
+        if len(large_indices) < 2:
+            return self.chunk_documents(documents)
+        
+        workers = workers or os.cpu_count() or 1
+        
+        # map submits every large document up front; chunk the small ones
+        # locally while the workers run
+        large_results = self._get_pool(workers).map(
+            _chunk_in_worker,
+            [documents[i] for i in large_indices],
+            chunksize=max(1, len(large_indices) // (workers * 4))
+        )
+        large_set = set(large_indices)
+        results = [
+            [] if i in large_set else self.chunk_documents([doc])
+            for i, doc in enumerate(documents)
+        ]
+        for i, doc_chunks in zip(large_indices, large_results):
+            results[i] = doc_chunks
+        
+        chunks = list(itertools.chain.from_iterable(results))
+        for i, chunk in enumerate(chunks):
+            chunk.metadata["chunk_id"] = i
+        
+        logger.info("Documents chunked in parallel", 
+                   original_docs=len(documents), 
+                   parallel_docs=len(large_indices),
+                   workers=workers,
+                   chunks=len(chunks))
+        return chunks
 
 class RecursiveCharacterChunker(BaseTextChunker):
     """Recursive character text chunker - good for most documents"""
     
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    # Separators in priority order: paragraph, line, word
+    _separators = ("\n\n", "\n", " ")
+    # Any separator character; a chunk's overlap restarts right after one
+    _restart_re = re.compile(r"[\n ]")
+    
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, use_langchain: bool = False):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""]
-        )
+        self.use_langchain = use_langchain
+        self.text_splitter = None
+        # Text digest -> chunk offsets, in least recently used order
+        self._offset_cache: "OrderedDict[bytes, List[Tuple[int, int]]]" = OrderedDict()
+        if use_langchain:
+            self.text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=["\n\n", "\n", " ", ""]
+            )
+        
+        # Chunker metadata shared by every chunk this chunker produces
+        self._base_metadata = {
+            "chunker": "RecursiveCharacterChunker",
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap
+        }
         
         logger.info("Initialized RecursiveCharacterChunker", 
                    chunk_size=chunk_size, 
-                   chunk_overlap=chunk_overlap)
+                   chunk_overlap=chunk_overlap,
+                   use_langchain=use_langchain)
+    
+    def _split_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """Find (start, end) offsets of chunks split at the coarsest fitting separator
+        
+        Windows are packed greedily, preferring paragraph over line over word
+        breaks in the second half of each window. Each break is located with
+        one str.rfind per separator, so the text is searched in C rather than
+        walked in Python. Overlap starts at a separator so chunks never begin
+        mid-word; text with no separator is hard cut. Offsets exclude
+        surrounding whitespace, so the text is sliced once per chunk.
+        """
+        chunk_size = self.chunk_size
+        overlap = self.chunk_overlap
+        text_length = len(text)
+        
+        separators = self._separators
+        find_restart = self._restart_re.search
+        
+        offsets = []
+        start = 0
+        while start < text_length:
+            limit = start + chunk_size
+            if limit >= text_length:
+                end = text_length
+            else:
+                end = -1
+                # Prefer the coarsest break late in the window, then any break.
+                # A break is a separator starting in (low, limit].
+                for low in (start + chunk_size // 2, start):
+                    for separator in separators:
+                        end = text.rfind(separator, low + 1, limit + len(separator))
+                        if end != -1:
+                            break
+                    if end != -1:
+                        break
+                if end == -1:
+                    end = limit
+            
+            # Trim whitespace by moving the bounds instead of str.strip()
+            piece_start, piece_end = start, end
+            while piece_start < piece_end and text[piece_start].isspace():
+                piece_start += 1
+            while piece_end > piece_start and text[piece_end - 1].isspace():
+                piece_end -= 1
+            if piece_start < piece_end:
+                offsets.append((piece_start, piece_end))
+            if end >= text_length:
+                break
+            
+            # Carry overlap from the first separator inside the overlap region
+            next_start = end
+            if overlap:
+                match = find_restart(text, max(end - overlap - 1, start), end - 1)
+                if match:
+                    next_start = match.end()
+                elif end - overlap > start:
+                    next_start = end - overlap
+            start = next_start
+        
+        return self._merge_offsets(offsets)
+    
+    def _merge_offsets(self, offsets: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Merge neighbouring chunks whose combined span still fits chunk_size
+        
+        Greedy packing leaves a short tail chunk, often mostly overlap, at
+        the end of a document; folding it into its neighbour saves an
+        embedding and a stored vector without exceeding chunk_size.
+        """
+        merged = []
+        for start, end in offsets:
+            if merged and end - merged[-1][0] <= self.chunk_size:
+                merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the chunker for pool workers, which start with an empty offset cache"""
+        state = super().__getstate__()
+        state["_offset_cache"] = OrderedDict()
+        return state
+    
+    def _cached_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """Get split offsets, reusing them when the same text is chunked again"""
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with _offset_cache_lock:
+            offsets = self._offset_cache.get(key)
+            if offsets is not None:
+                self._offset_cache.move_to_end(key)
+                return offsets
+        
+        # Split outside the lock so other threads only wait on cache updates
+        offsets = self._split_offsets(text)
+        with _offset_cache_lock:
+            self._offset_cache[key] = offsets
+            if len(self._offset_cache) > OFFSET_CACHE_SIZE:
+                self._offset_cache.popitem(last=False)
+        return offsets
+    
+    def _iter_pieces(self, text: str) -> Iterator[str]:
+        """Yield chunk strings sliced from the split offsets"""
+        for start, end in self._cached_offsets(text):
+            yield text[start:end]
+    
+    def iter_chunks(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Iterator[Document]:
+        """Yield chunks as the separator scan advances, without holding them all"""
+        if self.use_langchain:
+            pieces = self.text_splitter.split_text(text)
+        else:
+            pieces = self._iter_pieces(text)
+        
+        return self._make_chunks(pieces, metadata, self._base_metadata)
     
     def chunk_documents(self, documents: List[Document]) -> List[Document]:
         """Chunk documents using recursive character splitting"""
         try:
-            chunks = self.text_splitter.split_documents(documents)
+            if self.use_langchain:
+                chunks = self.text_splitter.split_documents(documents)
+            else:
+                chunks = [
+                    Document(page_content=piece, metadata=dict(document.metadata))
+                    for document in documents
+                    for piece in self._iter_pieces(document.page_content)
+                ]
             
             # Add chunk metadata
-            for i, chunk in enumerate(chunks):
-                chunk.metadata.update({
-                    "chunk_id": i,
-                    "chunker": "RecursiveCharacterChunker",
-                    "chunk_size": self.chunk_size,
-                    "chunk_overlap": self.chunk_overlap
-                })
+            chunker_metadata = self._base_metadata
+            chunk_digests = content_digests(chunk.page_content for chunk in chunks)
+            for i, (chunk, (chunk_hash, chunk_bytes)) in enumerate(zip(chunks, chunk_digests)):
+                chunk.metadata = {**chunk.metadata, **chunker_metadata, "chunk_id": i, 
+                                  "chunk_hash": chunk_hash, "chunk_bytes": chunk_bytes}
             
             logger.info("Documents chunked successfully", 
                        original_docs=len(documents), 
@@ -70,14 +333,7 @@ class RecursiveCharacterChunker(BaseTextChunker):
     def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Chunk text using recursive character splitting"""
         try:
-            if metadata is None:
-                metadata = {}
-            
-            # Create document from text
-            document = Document(page_content=text, metadata=metadata)
-            
-            # Chunk the document
-            chunks = self.chunk_documents([document])
+            chunks = list(self.iter_chunks(text, metadata))
             
             logger.info("Text chunked successfully", 
                        text_length=len(text), 
@@ -101,25 +357,76 @@ class CharacterChunker(BaseTextChunker):
             separator=separator
         )
         
+        # Chunker metadata shared by every chunk this chunker produces
+        self._base_metadata = {
+            "chunker": "CharacterChunker",
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "separator": self.separator
+        }
+        
+        # Without overlap, splitting is a plain str.split plus a greedy merge
+        self.fast_path = chunk_overlap == 0
+        
         logger.info("Initialized CharacterChunker", 
                    chunk_size=chunk_size, 
                    chunk_overlap=chunk_overlap,
-                   separator=separator)
+                   separator=separator,
+                   fast_path=self.fast_path)
+    
+    def _split_text(self, text: str) -> List[str]:
+        """Split text on the separator and merge the splits up to chunk_size
+        
+        Without overlap this matches LangChain's CharacterTextSplitter: the
+        separator is found by C-level str.split and adjacent splits are
+        joined greedily. Overlapping chunks still go through LangChain.
+        """
+        if not self.fast_path:
+            return self.text_splitter.split_text(text)
+        
+        separator = self.separator
+        separator_length = len(separator)
+        chunk_size = self.chunk_size
+        splits = text.split(separator) if separator else list(text)
+        
+        pieces = []
+        current = []
+        total = 0
+        for split in splits:
+            if not split:
+                continue
+            length = len(split)
+            if current and total + separator_length + length > chunk_size:
+                piece = separator.join(current).strip()
+                if piece:
+                    pieces.append(piece)
+                current = []
+                total = 0
+            total += length + (separator_length if current else 0)
+            current.append(split)
+        
+        if current:
+            piece = separator.join(current).strip()
+            if piece:
+                pieces.append(piece)
+        
+        return pieces
     
     def chunk_documents(self, documents: List[Document]) -> List[Document]:
         """Chunk documents using character splitting"""
         try:
-            chunks = self.text_splitter.split_documents(documents)
+            chunks = [
+                Document(page_content=piece, metadata=dict(document.metadata))
+                for document in documents
+                for piece in self._split_text(document.page_content)
+            ]
             
             # Add chunk metadata
-            for i, chunk in enumerate(chunks):
-                chunk.metadata.update({
-                    "chunk_id": i,
-                    "chunker": "CharacterChunker",
-                    "chunk_size": self.chunk_size,
-                    "chunk_overlap": self.chunk_overlap,
-                    "separator": self.separator
-                })
+            chunker_metadata = self._base_metadata
+            chunk_digests = content_digests(chunk.page_content for chunk in chunks)
+            for i, (chunk, (chunk_hash, chunk_bytes)) in enumerate(zip(chunks, chunk_digests)):
+                chunk.metadata = {**chunk.metadata, **chunker_metadata, "chunk_id": i, 
+                                  "chunk_hash": chunk_hash, "chunk_bytes": chunk_bytes}
             
             logger.info("Documents chunked successfully", 
                        original_docs=len(documents), 
@@ -130,17 +437,14 @@ class CharacterChunker(BaseTextChunker):
             logger.error("Failed to chunk documents", error=str(e))
             raise
     
+    def iter_chunks(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Iterator[Document]:
+        """Split text directly, building each chunk's metadata once"""
+        return self._make_chunks(self._split_text(text), metadata, self._base_metadata)
+    
     def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Chunk text using character splitting"""
         try:
-            if metadata is None:
-                metadata = {}
-            
-            # Create document from text
-            document = Document(page_content=text, metadata=metadata)
-            
-            # Chunk the document
-            chunks = self.chunk_documents([document])
+            chunks = list(self.iter_chunks(text, metadata))
             
             logger.info("Text chunked successfully", 
                        text_length=len(text), 
@@ -154,31 +458,67 @@ class CharacterChunker(BaseTextChunker):
 class TokenChunker(BaseTextChunker):
     """Token-based text chunker"""
     
-    def __init__(self, chunk_size: int = 512, chunk_overlap: int = 50):
+    # Encodings by name, shared by every TokenChunker in the process
+    _shared_encodings: Dict[str, "tiktoken.Encoding"] = {}
+    
+    def __init__(self, chunk_size: int = 512, chunk_overlap: int = 50, encoding_name: str = "gpt2"):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.text_splitter = TokenTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap
-        )
+        self.encoding_name = encoding_name
+        
+        # Chunker metadata shared by every chunk this chunker produces
+        self._base_metadata = {
+            "chunker": "TokenChunker",
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap
+        }
         
         logger.info("Initialized TokenChunker", 
                    chunk_size=chunk_size, 
-                   chunk_overlap=chunk_overlap)
+                   chunk_overlap=chunk_overlap,
+                   encoding_name=encoding_name)
+    
+    @property
+    def encoding(self) -> "tiktoken.Encoding":
+        """Get the tiktoken encoding, loading it on first use in this process"""
+        encoding = self._shared_encodings.get(self.encoding_name)
+        if encoding is None:
+            encoding = tiktoken.get_encoding(self.encoding_name)
+            self._shared_encodings[self.encoding_name] = encoding
+        return encoding
+    
+    def _split_text(self, text: str) -> List[str]:
+        """Encode text once, window the token IDs and decode all windows in one batch
+        
+        Windows advance by chunk_size - chunk_overlap tokens and the last one
+        ends at the final token, matching LangChain's TokenTextSplitter.
+        """
+        token_ids = self.encoding.encode_ordinary(text)
+        step = self.chunk_size - self.chunk_overlap
+        
+        windows = []
+        for start in range(0, len(token_ids), step):
+            windows.append(token_ids[start:start + self.chunk_size])
+            if start + self.chunk_size >= len(token_ids):
+                break
+        
+        return self.encoding.decode_batch(windows)
     
     def chunk_documents(self, documents: List[Document]) -> List[Document]:
         """Chunk documents using token splitting"""
         try:
-            chunks = self.text_splitter.split_documents(documents)
+            chunks = [
+                Document(page_content=piece, metadata=dict(document.metadata))
+                for document in documents
+                for piece in self._split_text(document.page_content)
+            ]
             
             # Add chunk metadata
-            for i, chunk in enumerate(chunks):
-                chunk.metadata.update({
-                    "chunk_id": i,
-                    "chunker": "TokenChunker",
-                    "chunk_size": self.chunk_size,
-                    "chunk_overlap": self.chunk_overlap
-                })
+            chunker_metadata = self._base_metadata
+            chunk_digests = content_digests(chunk.page_content for chunk in chunks)
+            for i, (chunk, (chunk_hash, chunk_bytes)) in enumerate(zip(chunks, chunk_digests)):
+                chunk.metadata = {**chunk.metadata, **chunker_metadata, "chunk_id": i, 
+                                  "chunk_hash": chunk_hash, "chunk_bytes": chunk_bytes}
             
             logger.info("Documents chunked successfully", 
                        original_docs=len(documents), 
@@ -189,17 +529,14 @@ class TokenChunker(BaseTextChunker):
             logger.error("Failed to chunk documents", error=str(e))
             raise
     
+    def iter_chunks(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Iterator[Document]:
+        """Split text directly, building each chunk's metadata once"""
+        return self._make_chunks(self._split_text(text), metadata, self._base_metadata)
+    
     def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Chunk text using token splitting"""
         try:
-            if metadata is None:
-                metadata = {}
-            
-            # Create document from text
-            document = Document(page_content=text, metadata=metadata)
-            
-            # Chunk the document
-            chunks = self.chunk_documents([document])
+            chunks = list(self.iter_chunks(text, metadata))
             
             logger.info("Text chunked successfully", 
                        text_length=len(text), 
@@ -214,15 +551,17 @@ class ChunkerManager:
     """Manager for different text chunkers"""
     
     def __init__(self):
-        self.chunkers = {
-            "recursive": RecursiveCharacterChunker(),
-            "character": CharacterChunker(),
-            "token": TokenChunker()
+        # Chunkers are built on first use; TokenChunker loads a tokenizer
+        self._factories = {
+            "recursive": RecursiveCharacterChunker,
+            "character": CharacterChunker,
+            "token": TokenChunker
         }
+        self._instances: Dict[str, BaseTextChunker] = {}
         self.default_chunker = "recursive"
         
         logger.info("Initialized ChunkerManager", 
-                   available_chunkers=list(self.chunkers.keys()),
+                   available_chunkers=list(self._factories.keys()),
                    default_chunker=self.default_chunker)
     
     def get_chunker(self, chunker_type: Optional[str] = None) -> BaseTextChunker:
@@ -230,27 +569,49 @@ class ChunkerManager:
         if chunker_type is None:
             chunker_type = self.default_chunker
         
-        if chunker_type not in self.chunkers:
+        if chunker_type not in self._factories:
             logger.warning("Unknown chunker type, using default", 
                           requested_type=chunker_type,
                           default_type=self.default_chunker)
             chunker_type = self.default_chunker
         
-        return self.chunkers[chunker_type]
+        chunker = self._instances.get(chunker_type)
+        if chunker is None:
+            chunker = self._instances[chunker_type] = self._factories[chunker_type]()
+        return chunker
+    
+    def shutdown(self):
+        """Stop the worker pools of every chunker built so far"""
+        for chunker in self._instances.values():
+            chunker.shutdown_pool()
     
-    def chunk_documents(self, documents: List[Document], chunker_type: Optional[str] = None) -> List[Document]:
-        """Chunk documents using specified chunker"""
+    def chunk_documents(self, documents: List[Document], chunker_type: Optional[str] = None,
+                        workers: Optional[int] = None) -> List[Document]:
+        """Chunk documents using specified chunker, across worker processes if workers is set"""
         chunker = self.get_chunker(chunker_type)
+        if workers:
+            return chunker.chunk_documents_parallel(documents, workers)
         return chunker.chunk_documents(documents)
     
+    def chunk_documents_parallel(self, documents: List[Document], chunker_type: Optional[str] = None,
+                                 workers: Optional[int] = None) -> List[Document]:
+        """Chunk documents across worker processes using specified chunker"""
+        chunker = self.get_chunker(chunker_type)
+        return chunker.chunk_documents_parallel(documents, workers)
+    
     def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None, chunker_type: Optional[str] = None) -> List[Document]:
         """Chunk text using specified chunker"""
         chunker = self.get_chunker(chunker_type)
         return chunker.chunk_text(text, metadata)
     
+    def iter_chunks(self, text: str, metadata: Optional[Dict[str, Any]] = None, chunker_type: Optional[str] = None) -> Iterator[Document]:
+        """Lazily chunk text using specified chunker"""
+        chunker = self.get_chunker(chunker_type)
+        return chunker.iter_chunks(text, metadata)
+    
     def get_available_chunkers(self) -> List[str]:
         """Get list of available chunker types"""
-        return list(self.chunkers.keys())
+        return list(self._factories.keys())
 
 # Global instance
 chunker_manager = ChunkerManager() 
\ No newline at end of file
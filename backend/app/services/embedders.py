@@ -1,5 +1,6 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 import numpy as np
 from sentence_transformers import SentenceTransformer
 import torch
@@ -9,12 +10,15 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Single-text embeddings kept per manager so repeated queries skip the model
+TEXT_EMBEDDING_CACHE_SIZE = 1024
+
 class BaseEmbedder(ABC):
     """Base class for embedders"""
     
     @abstractmethod
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for a list of texts"""
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for a list of texts as a float32 (N, dim) array"""
         pass
     
     @abstractmethod
@@ -61,22 +65,19 @@ class SentenceTransformerEmbedder(BaseEmbedder):
                         error=str(e))
             raise
     
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for a list of texts"""
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for a list of texts as a float32 (N, dim) array"""
         try:
             if not texts:
-                return []
-            
-            # Generate embeddings
-            embeddings = self.model.encode(texts, convert_to_tensor=False)
+                return np.empty((0, self.dimension), dtype=np.float32)
             
-            # Convert to list of lists
-            if isinstance(embeddings, np.ndarray):
-                embeddings = embeddings.tolist()
+            # Generate embeddings, kept as a contiguous float32 array
+            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            embeddings = np.asarray(embeddings, dtype=np.float32)
             
             logger.info("Generated embeddings", 
                        text_count=len(texts),
-                       embedding_dimension=len(embeddings[0]) if embeddings else 0)
+                       embedding_dimension=embeddings.shape[1])
             
             return embeddings
             
@@ -112,20 +113,21 @@ class BatchEmbedder:
         self.embedder = embedder
         self.batch_size = batch_size
     
-    def embed_texts_in_batches(self, texts: List[str]) -> List[List[float]]:
+    def embed_texts_in_batches(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings in batches for efficiency"""
         try:
-            all_embeddings = []
+            all_embeddings = np.empty(
+                (len(texts), self.embedder.get_embedding_dimension()), dtype=np.float32
+            )
             
             for i in range(0, len(texts), self.batch_size):
                 batch_texts = texts[i:i + self.batch_size]
-                batch_embeddings = self.embedder.embed_texts(batch_texts)
-                all_embeddings.extend(batch_embeddings)
+                all_embeddings[i:i + len(batch_texts)] = self.embedder.embed_texts(batch_texts)
                 
                 logger.info("Processed batch", 
                            batch_number=i // self.batch_size + 1,
                            batch_size=len(batch_texts),
-                           total_processed=len(all_embeddings))
+                           total_processed=i + len(batch_texts))
             
             return all_embeddings
             
@@ -139,6 +141,7 @@ class EmbeddingManager:
     def __init__(self):
         self.embedders = {}
         self.default_embedder = None
+        self._text_cache: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
         self._initialize_default_embedder()
     
     def _initialize_default_embedder(self):
@@ -160,15 +163,25 @@ class EmbeddingManager:
         
         return self.embedders[embedder_name]
     
-    def embed_texts(self, texts: List[str], embedder_name: str = "default") -> List[List[float]]:
+    def embed_texts(self, texts: List[str], embedder_name: str = "default") -> np.ndarray:
         """Generate embeddings using specified embedder"""
         embedder = self.get_embedder(embedder_name)
         return embedder.embed_texts(texts)
     
     def embed_text(self, text: str, embedder_name: str = "default") -> List[float]:
-        """Generate embedding using specified embedder"""
+        """Generate embedding using specified embedder, reusing recent results for the same text"""
+        key = (embedder_name, text)
+        embedding = self._text_cache.get(key)
+        if embedding is not None:
+            self._text_cache.move_to_end(key)
+            return embedding
+        
         embedder = self.get_embedder(embedder_name)
-        return embedder.embed_text(text)
+        embedding = embedder.embed_text(text)
+        self._text_cache[key] = embedding
+        if len(self._text_cache) > TEXT_EMBEDDING_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return embedding
     
     def get_embedding_dimension(self, embedder_name: str = "default") -> int:
         """Get embedding dimension"""
@@ -178,6 +191,8 @@ class EmbeddingManager:
     def add_embedder(self, name: str, embedder: BaseEmbedder):
         """Add a new embedder"""
         self.embedders[name] = embedder
+        # A replaced embedder must not serve its predecessor's vectors
+        self._text_cache.clear()
         logger.info("Added embedder", name=name)
     
     def get_available_embedders(self) -> List[str]:
@@ -1,7 +1,9 @@
-from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Union
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Union, Tuple
 from abc import ABC, abstractmethod
 import asyncio
-import json
+import orjson
+import threading
+import time
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 import openai
@@ -12,6 +14,32 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds an availability probe result is trusted before the model is called again
+AVAILABILITY_CACHE_TTL = 300.0
+
+# Seconds a failed probe is trusted, kept short so a recovered provider is used again quickly
+UNAVAILABLE_CACHE_TTL = 5.0
+
+# Seconds past the TTL an old successful result is still served while a background probe refreshes it
+AVAILABILITY_STALE_TTL = 120.0
+
+# Instructions placed ahead of the retrieved context in every prompt
+CONTEXT_PREAMBLE = (
+    "You are a helpful assistant. Use the following context to answer questions. "
+    "If the answer is not in the context, please say so.\n\nContext:\n"
+)
+
+def _availability_ttl(available: bool) -> float:
+    """Get how long a probe result is trusted; failures expire much sooner than successes"""
+    return AVAILABILITY_CACHE_TTL if available else UNAVAILABLE_CACHE_TTL
+
+def _format_context(context: List[Dict[str, Any]]) -> str:
+    """Render retrieved chunks into the context message shared by all providers"""
+    return CONTEXT_PREAMBLE + "\n\n".join(
+        f"Source: {(doc.get('metadata') or {}).get('source', 'Unknown')}\n{doc.get('text', '')}"
+        for doc in context
+    )
+
 class BaseLLMProvider(ABC):
     """Base class for LLM providers"""
     
@@ -76,19 +104,9 @@ class AWSBedrockProvider(BaseLLMProvider):
         
         if context:
             # Add assistant message with context
-            context_text = "\n\n".join([
-                f"Source: {doc.get('metadata', {}).get('source', 'Unknown')}\n{doc.get('text', '')}"
-                for doc in context
-            ])
-            
-            context_message = f"""You are a helpful assistant. Use the following context to answer questions. If the answer is not in the context, please say so.
-
-Context:
-{context_text}"""
-            
             messages.append({
                 "role": "assistant",
-                "content": [{"type": "text", "text": context_message}]
+                "content": [{"type": "text", "text": _format_context(context)}]
             })
             
             # Add another user message to ask the actual question
@@ -117,21 +135,20 @@ Context:
             
             # Make request
             response = self.client.invoke_model(
-                body=json.dumps(body),
+                body=orjson.dumps(body),
                 modelId=self.model_id,
                 accept="application/json",
                 contentType="application/json"
             )
             
             # Parse response
-            response_body = json.loads(response.get('body').read())
+            response_body = orjson.loads(response.get('body').read())
             content = response_body.get('content', [])
             
-            # Extract text from response content
-            response_text = ""
-            for block in content:
-                if block.get('type') == 'text':
-                    response_text += block.get('text', '')
+            # Extract text from response content in a single join
+            response_text = "".join(
+                block.get('text', '') for block in content if block.get('type') == 'text'
+            )
             
             logger.info("Generated response with AWS Bedrock", 
                        prompt_length=len(prompt),
@@ -161,7 +178,7 @@ Context:
             
             # Make streaming request
             response = self.client.invoke_model_with_response_stream(
-                body=json.dumps(body),
+                body=orjson.dumps(body),
                 modelId=self.model_id,
                 accept="application/json",
                 contentType="application/json"
@@ -169,7 +186,7 @@ Context:
             
             # Process streaming response
             for event in response.get('body'):
-                chunk = json.loads(event['chunk']['bytes'])
+                chunk = orjson.loads(event['chunk']['bytes'])
                 if 'content' in chunk:
                     for block in chunk['content']:
                         if block.get('type') == 'text':
@@ -196,7 +213,7 @@ Context:
             }
             
             response = self.client.invoke_model(
-                body=json.dumps(body),
+                body=orjson.dumps(body),
                 modelId=self.model_id,
                 accept="application/json",
                 contentType="application/json"
@@ -237,17 +254,7 @@ class OpenAIProvider(BaseLLMProvider):
         
         if context:
             # Add system message with context
-            context_text = "\n\n".join([
-                f"Source: {doc.get('metadata', {}).get('source', 'Unknown')}\n{doc.get('text', '')}"
-                for doc in context
-            ])
-            
-            system_message = f"""You are a helpful assistant. Use the following context to answer questions. If the answer is not in the context, please say so.
-
-Context:
-{context_text}"""
-            
-            messages.append({"role": "system", "content": system_message})
+            messages.append({"role": "system", "content": _format_context(context)})
         
         # Add user message
         messages.append({"role": "user", "content": prompt})
@@ -337,42 +344,105 @@ class LLMManager:
             "openai": OpenAIProvider()
         }
         self.provider_order = ["bedrock", "openai"]  # Primary to fallback
+        self._availability: Dict[str, Tuple[float, bool]] = {}
+        self._probe_locks = {name: threading.Lock() for name in self.providers}
     
-    def _get_available_provider(self) -> Optional[BaseLLMProvider]:
+    def _cached_availability(self, provider_name: str) -> Optional[bool]:
+        """Get the last probe result if it is younger than its TTL"""
+        cached = self._availability.get(provider_name)
+        if cached and time.monotonic() - cached[0] < _availability_ttl(cached[1]):
+            return cached[1]
+        return None
+    
+    def _is_available(self, provider_name: str) -> bool:
+        """Check provider availability, reusing the last probe result until its TTL expires
+        
+        A successful result up to AVAILABILITY_STALE_TTL seconds past its TTL
+        is still returned, and a fresh probe is started in the background, so
+        only callers with no usable result wait on the model. Expired failures
+        are always probed again before answering.
+        """
+        cached = self._availability.get(provider_name)
+        if cached:
+            age = time.monotonic() - cached[0]
+            if age < _availability_ttl(cached[1]):
+                return cached[1]
+            if cached[1] and age < AVAILABILITY_CACHE_TTL + AVAILABILITY_STALE_TTL:
+                self._refresh_in_background(provider_name)
+                return cached[1]
+        
+        # Concurrent callers wait for one probe instead of each calling the model
+        with self._probe_locks[provider_name]:
+            available = self._cached_availability(provider_name)
+            if available is None:
+                available = self.providers[provider_name].is_available()
+                self._availability[provider_name] = (time.monotonic(), available)
+        return available
+    
+    def _refresh_in_background(self, provider_name: str):
+        """Start a probe in a daemon thread unless one is already running"""
+        lock = self._probe_locks[provider_name]
+        if lock.acquire(blocking=False):
+            threading.Thread(
+                target=self._probe_and_release, args=(provider_name, lock), daemon=True
+            ).start()
+    
+    def _probe_and_release(self, provider_name: str, lock: threading.Lock):
+        """Probe a provider, record the result and release its probe lock"""
+        try:
+            available = self.providers[provider_name].is_available()
+            self._availability[provider_name] = (time.monotonic(), available)
+        finally:
+            lock.release()
+    
+    def _forget_availability(self, provider_name: str):
+        """Forget a cached probe so the next request checks the provider again"""
+        self._availability.pop(provider_name, None)
+    
+    def _get_available_provider(self) -> Optional[Tuple[str, BaseLLMProvider]]:
         """Get the first available provider"""
         for provider_name in self.provider_order:
-            provider = self.providers[provider_name]
-            if provider.is_available():
+            if self._is_available(provider_name):
                 logger.info("Using provider", provider=provider_name)
-                return provider
+                return provider_name, self.providers[provider_name]
         
         logger.error("No LLM providers available")
         return None
     
     async def generate_response(self, prompt: str, context: Optional[List[Dict[str, Any]]] = None) -> str:
         """Generate a response using the first available provider"""
-        provider = self._get_available_provider()
-        if not provider:
+        selected = self._get_available_provider()
+        if not selected:
             raise Exception("No LLM providers available")
         
-        return await provider.generate_response(prompt, context)
+        provider_name, provider = selected
+        try:
+            return await provider.generate_response(prompt, context)
+        except Exception:
+            self._forget_availability(provider_name)
+            raise
     
     async def generate_streaming_response(self, prompt: str, context: Optional[List[Dict[str, Any]]] = None) -> AsyncIterator[str]:
         """Generate a streaming response using the first available provider"""
-        provider = self._get_available_provider()
-        if not provider:
+        selected = self._get_available_provider()
+        if not selected:
             raise Exception("No LLM providers available")
         
-        async for chunk in provider.generate_streaming_response(prompt, context):
-            yield chunk
+        provider_name, provider = selected
+        try:
+            async for chunk in provider.generate_streaming_response(prompt, context):
+                yield chunk
+        except Exception:
+            self._forget_availability(provider_name)
+            raise
     
     def get_available_providers(self) -> List[str]:
         """Get list of available providers"""
-        return [name for name, provider in self.providers.items() if provider.is_available()]
+        return [name for name in self.providers if self._is_available(name)]
     
     def health_check(self) -> Dict[str, bool]:
         """Check health of all providers"""
-        return {name: provider.is_available() for name, provider in self.providers.items()}
+        return {name: self._is_available(name) for name in self.providers}
 
 # Global instance
 llm_manager = LLMManager() 
\ No newline at end of file
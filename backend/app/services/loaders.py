@@ -1,5 +1,4 @@
-from typing import List, Dict, Any, Optional
-from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 import os
 from abc import ABC, abstractmethod
 
@@ -19,19 +18,23 @@ logger = get_logger(__name__)
 class BaseDocumentLoader(ABC):
     """Base class for document loaders"""
     
+    # Lowercase file extensions, with the leading dot, this loader handles
+    extensions: Tuple[str, ...] = ()
+    
     @abstractmethod
     def load(self, file_path: str) -> List[Document]:
         """Load document and return LangChain Document objects"""
         pass
     
-    @abstractmethod
     def supports_file_type(self, file_extension: str) -> bool:
         """Check if this loader supports the given file extension"""
-        pass
+        return file_extension.lower() in self.extensions
 
 class PDFDocumentLoader(BaseDocumentLoader):
     """PDF document loader"""
     
+    extensions = (".pdf",)
+    
     def load(self, file_path: str) -> List[Document]:
         """Load PDF document"""
         try:
@@ -54,13 +57,12 @@ class PDFDocumentLoader(BaseDocumentLoader):
         except Exception as e:
             logger.error("Failed to load PDF", file_path=file_path, error=str(e))
             raise
-    
-    def supports_file_type(self, file_extension: str) -> bool:
-        return file_extension.lower() == ".pdf"
 
 class WordDocumentLoader(BaseDocumentLoader):
     """Word document loader"""
     
+    extensions = (".docx", ".doc")
+    
     def load(self, file_path: str) -> List[Document]:
         """Load Word document"""
         try:
@@ -83,13 +85,12 @@ class WordDocumentLoader(BaseDocumentLoader):
         except Exception as e:
             logger.error("Failed to load Word document", file_path=file_path, error=str(e))
             raise
-    
-    def supports_file_type(self, file_extension: str) -> bool:
-        return file_extension.lower() in [".docx", ".doc"]
 
 class MarkdownDocumentLoader(BaseDocumentLoader):
     """Markdown document loader"""
     
+    extensions = (".md", ".markdown")
+    
     def load(self, file_path: str) -> List[Document]:
         """Load Markdown document"""
         try:
@@ -112,13 +113,12 @@ class MarkdownDocumentLoader(BaseDocumentLoader):
         except Exception as e:
             logger.error("Failed to load Markdown document", file_path=file_path, error=str(e))
             raise
-    
-    def supports_file_type(self, file_extension: str) -> bool:
-        return file_extension.lower() in [".md", ".markdown"]
 
 class TextDocumentLoader(BaseDocumentLoader):
     """Plain text document loader"""
     
+    extensions = (".txt",)
+    
     def load(self, file_path: str) -> List[Document]:
         """Load text document"""
         try:
@@ -141,9 +141,6 @@ class TextDocumentLoader(BaseDocumentLoader):
         except Exception as e:
             logger.error("Failed to load text document", file_path=file_path, error=str(e))
             raise
-    
-    def supports_file_type(self, file_extension: str) -> bool:
-        return file_extension.lower() == ".txt"
 
 class DocumentLoaderManager:
     """Manager for different document loaders"""
@@ -155,40 +152,33 @@ class DocumentLoaderManager:
             MarkdownDocumentLoader(),
             TextDocumentLoader()
         ]
+        # Extension -> loader, built once; the first loader listed wins
+        self._loaders_by_extension: Dict[str, BaseDocumentLoader] = {}
+        for loader in self.loaders:
+            for extension in loader.extensions:
+                self._loaders_by_extension.setdefault(extension, loader)
     
     def load_document(self, file_path: str) -> List[Document]:
         """Load document using appropriate loader"""
-        file_extension = Path(file_path).suffix
+        file_extension = os.path.splitext(file_path)[1]
         
         # Find appropriate loader
-        for loader in self.loaders:
-            if loader.supports_file_type(file_extension):
-                logger.info("Loading document", 
-                           file_path=file_path, 
-                           loader=loader.__class__.__name__)
-                return loader.load(file_path)
+        loader = self._loaders_by_extension.get(file_extension.lower())
+        if loader is None:
+            raise ValueError(f"No loader found for file type: {file_extension}")
         
-        # If no loader found, raise error
-        raise ValueError(f"No loader found for file type: {file_extension}")
+        logger.info("Loading document", 
+                   file_path=file_path, 
+                   loader=loader.__class__.__name__)
+        return loader.load(file_path)
     
     def get_supported_extensions(self) -> List[str]:
         """Get list of supported file extensions"""
-        extensions = []
-        for loader in self.loaders:
-            if isinstance(loader, PDFDocumentLoader):
-                extensions.append(".pdf")
-            elif isinstance(loader, WordDocumentLoader):
-                extensions.extend([".docx", ".doc"])
-            elif isinstance(loader, MarkdownDocumentLoader):
-                extensions.extend([".md", ".markdown"])
-            elif isinstance(loader, TextDocumentLoader):
-                extensions.append(".txt")
-        return extensions
+        return list(self._loaders_by_extension)
     
     def is_supported_file(self, file_path: str) -> bool:
         """Check if file is supported"""
-        file_extension = Path(file_path).suffix
-        return file_extension.lower() in self.get_supported_extensions()
+        return os.path.splitext(file_path)[1].lower() in self._loaders_by_extension
 
 class CustomDataLoader:
     """Loader for custom data pushed from other tools"""
@@ -1,11 +1,16 @@
-from typing import List, Dict, Any, Optional, AsyncIterator
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterable, Iterator, Tuple
+from itertools import islice
 import os
+import time
 import asyncio
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from sqlalchemy.orm import Session
+from langchain_core.documents import Document
+from structlog.contextvars import bind_contextvars, unbind_contextvars
 
-from app.core.database import get_db, Document as DocumentModel, DocumentChunk
+from app.core.database import get_db, bulk_insert, Document as DocumentModel, DocumentChunk
 from app.core.vector_store import vector_store
 from app.core.logging import get_logger
 from app.services.loaders import document_loader_manager, custom_data_loader
@@ -15,6 +20,25 @@ from app.services.llm_providers import llm_manager
 
 logger = get_logger(__name__)
 
+# Chunks embedded, stored and recorded per round while indexing a document
+INDEX_BATCH_SIZE = 256
+
+# Embedded batches that may wait for storage while the next one is embedded
+INDEX_PREFETCH_BATCHES = 2
+
+# Texts whose document records are created and committed together in ingest_texts
+INGEST_BATCH_SIZE = 64
+
+# Content types recorded for uploaded files, by lowercase extension
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".markdown": "text/markdown"
+}
+
 class RAGPipeline:
     """Core RAG pipeline orchestrating all components"""
     
@@ -28,6 +52,7 @@ class RAGPipeline:
     async def ingest_file(self, file_path: str, source_tool: str = "manual_upload", 
                          metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Ingest a file into the RAG system"""
+        started = time.monotonic()
         db = next(get_db())
         
         try:
@@ -46,12 +71,12 @@ class RAGPipeline:
             db.commit()
             db.refresh(doc_record)
             
-            logger.info("Started file ingestion", 
-                       file_path=file_path,
-                       document_id=doc_record.id)
+            # Every log line while processing this document carries its ID
+            bind_contextvars(document_id=doc_record.id)
+            logger.info("Started file ingestion", file_path=file_path)
             
             # Process the file
-            result = await self._process_document(db, doc_record)
+            result = await self._process_document(db, doc_record, started)
             
             return result
             
@@ -66,10 +91,12 @@ class RAGPipeline:
             
             raise
         finally:
+            unbind_contextvars("document_id")
             db.close()
     
     async def ingest_text(self, text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Ingest text content directly into the RAG system"""
+        started = time.monotonic()
         db = next(get_db())
         
         try:
@@ -87,12 +114,12 @@ class RAGPipeline:
             db.commit()
             db.refresh(doc_record)
             
-            logger.info("Started text ingestion", 
-                       text_length=len(text),
-                       document_id=doc_record.id)
+            # Every log line while processing this document carries its ID
+            bind_contextvars(document_id=doc_record.id)
+            logger.info("Started text ingestion", text_length=len(text))
             
             # Process the text
-            result = await self._process_text(db, doc_record, text)
+            result = await self._process_text(db, doc_record, text, started)
             
             return result
             
@@ -107,71 +134,45 @@ class RAGPipeline:
             
             raise
         finally:
+            unbind_contextvars("document_id")
             db.close()
     
-    async def _process_document(self, db: Session, doc_record: DocumentModel) -> Dict[str, Any]:
+    async def _process_document(self, db: Session, doc_record: DocumentModel, 
+                                started: float) -> Dict[str, Any]:
         """Process a document file through the RAG pipeline"""
         try:
-            # Load document
-            documents = self.document_loader.load_document(doc_record.file_path)
-            
-            # Chunk documents
-            chunks = self.text_chunker.chunk_documents(documents)
-            
-            # Generate embeddings
-            texts = [chunk.page_content for chunk in chunks]
-            embeddings = self.embedding_manager.embed_texts(texts)
-            
-            # Prepare metadata for vector store
-            metadatas = []
-            for i, chunk in enumerate(chunks):
-                chunk_metadata = {
-                    "document_id": doc_record.id,
-                    "chunk_index": i,
-                    "source": doc_record.filename,
-                    "source_tool": doc_record.source_tool,
-                    **chunk.metadata
-                }
-                metadatas.append(chunk_metadata)
-            
-            # Add to vector store
-            vector_ids = self.vector_store.add_vectors(texts, embeddings, metadatas)
-            
-            # Save chunk records
-            for i, (chunk, vector_id) in enumerate(zip(chunks, vector_ids)):
-                chunk_record = DocumentChunk(
-                    document_id=doc_record.id,
-                    chunk_index=i,
-                    chunk_text=chunk.page_content,
-                    chunk_hash=chunk.metadata.get("chunk_hash", ""),
-                    vector_id=vector_id,
-                    metadata_json=chunk.metadata
-                )
-                db.add(chunk_record)
+            # Load document; parsers are blocking, so keep them off the event loop
+            documents = await asyncio.to_thread(self.document_loader.load_document, doc_record.file_path)
+            
+            # Chunk documents, splitting large pages in worker processes
+            chunks = await asyncio.to_thread(self.text_chunker.chunk_documents_parallel, documents)
+            
+            # Embed, store and record chunks
+            chunk_count = await self._index_chunks(db, doc_record, chunks)
             
             # Update document status
             doc_record.status = "indexed"
             doc_record.indexed_at = datetime.utcnow()
-            doc_record.chunk_count = len(chunks)
+            doc_record.chunk_count = chunk_count
             
             db.commit()
             
-            logger.info("Document processed successfully", 
-                       document_id=doc_record.id,
-                       chunks=len(chunks))
+            logger.info("Document processed successfully", chunks=chunk_count)
             
             return {
                 "document_id": doc_record.id,
                 "filename": doc_record.filename,
                 "status": "indexed",
-                "chunk_count": len(chunks),
-                "processing_time": (datetime.utcnow() - doc_record.created_at).total_seconds()
+                "chunk_count": chunk_count,
+                "processing_time": time.monotonic() - started
             }
             
         except Exception as e:
-            logger.error("Failed to process document", 
-                        document_id=doc_record.id, 
-                        error=str(e))
+            logger.error("Failed to process document", error=str(e))
+            
+            # Drop this document's unsaved chunk rows and the points already stored
+            db.rollback()
+            self.vector_store.delete_document_vectors([doc_record.id])
             
             doc_record.status = "failed"
             doc_record.error_message = str(e)
@@ -179,69 +180,42 @@ class RAGPipeline:
             
             raise
     
-    async def _process_text(self, db: Session, doc_record: DocumentModel, text: str) -> Dict[str, Any]:
+    async def _process_text(self, db: Session, doc_record: DocumentModel, text: str, 
+                            started: float) -> Dict[str, Any]:
         """Process text content through the RAG pipeline"""
         try:
             # Create document from text
             document = custom_data_loader.load_from_text(text, doc_record.metadata_json)
             
-            # Chunk document
-            chunks = self.text_chunker.chunk_documents([document])
-            
-            # Generate embeddings
-            texts = [chunk.page_content for chunk in chunks]
-            embeddings = self.embedding_manager.embed_texts(texts)
-            
-            # Prepare metadata for vector store
-            metadatas = []
-            for i, chunk in enumerate(chunks):
-                chunk_metadata = {
-                    "document_id": doc_record.id,
-                    "chunk_index": i,
-                    "source": doc_record.filename,
-                    "source_tool": doc_record.source_tool,
-                    **chunk.metadata
-                }
-                metadatas.append(chunk_metadata)
-            
-            # Add to vector store
-            vector_ids = self.vector_store.add_vectors(texts, embeddings, metadatas)
-            
-            # Save chunk records
-            for i, (chunk, vector_id) in enumerate(zip(chunks, vector_ids)):
-                chunk_record = DocumentChunk(
-                    document_id=doc_record.id,
-                    chunk_index=i,
-                    chunk_text=chunk.page_content,
-                    chunk_hash=chunk.metadata.get("chunk_hash", ""),
-                    vector_id=vector_id,
-                    metadata_json=chunk.metadata
-                )
-                db.add(chunk_record)
+            # Chunk lazily; each batch is indexed as soon as it fills
+            chunks = self.text_chunker.iter_chunks(document.page_content, document.metadata)
+            
+            # Embed, store and record chunks
+            chunk_count = await self._index_chunks(db, doc_record, chunks)
             
             # Update document status
             doc_record.status = "indexed"
             doc_record.indexed_at = datetime.utcnow()
-            doc_record.chunk_count = len(chunks)
+            doc_record.chunk_count = chunk_count
             
             db.commit()
             
-            logger.info("Text processed successfully", 
-                       document_id=doc_record.id,
-                       chunks=len(chunks))
+            logger.info("Text processed successfully", chunks=chunk_count)
             
             return {
                 "document_id": doc_record.id,
                 "filename": doc_record.filename,
                 "status": "indexed",
-                "chunk_count": len(chunks),
-                "processing_time": (datetime.utcnow() - doc_record.created_at).total_seconds()
+                "chunk_count": chunk_count,
+                "processing_time": time.monotonic() - started
             }
             
         except Exception as e:
-            logger.error("Failed to process text", 
-                        document_id=doc_record.id, 
-                        error=str(e))
+            logger.error("Failed to process text", error=str(e))
+            
+            # Drop this document's unsaved chunk rows and the points already stored
+            db.rollback()
+            self.vector_store.delete_document_vectors([doc_record.id])
             
             doc_record.status = "failed"
             doc_record.error_message = str(e)
@@ -249,6 +223,220 @@ class RAGPipeline:
             
             raise
     
+    async def _index_chunks(self, db: Session, doc_record: DocumentModel, 
+                           chunks: Iterable[Document]) -> int:
+        """Embed, store and record a document's chunks in bounded batches
+        
+        Returns the number of chunks indexed.
+        """
+        return await self._index_document_chunks(
+            db, ((doc_record, i, chunk) for i, chunk in enumerate(chunks))
+        )
+    
+    async def _index_document_chunks(self, db: Session, 
+                                     doc_chunks: Iterable[Tuple[DocumentModel, int, Document]]) -> int:
+        """Embed, store and record (document, chunk index, chunk) triples in bounded batches
+        
+        Chunks are consumed INDEX_BATCH_SIZE at a time, so lazily produced
+        chunks are never all held in memory, and chunks of several small
+        documents share one embedding batch. Returns the number indexed.
+        """
+        doc_chunks = iter(doc_chunks)
+        chunk_count = 0
+        
+        # Chunking and embedding run in a worker thread and feed this queue,
+        # so the next batch is embedded while the previous one is stored
+        queue: asyncio.Queue = asyncio.Queue(maxsize=INDEX_PREFETCH_BATCHES)
+        
+        async def produce():
+            try:
+                while True:
+                    embedded = await asyncio.to_thread(self._embed_next_batch, doc_chunks)
+                    if embedded is None:
+                        break
+                    await queue.put(embedded)
+            except Exception:
+                # Wake the consumer; the error is raised when it awaits us
+                await queue.put(None)
+                raise
+            await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
+        
+        try:
+            while True:
+                embedded = await queue.get()
+                if embedded is None:
+                    break
+                batch, texts, embeddings = embedded
+                
+                # Prepare metadata for vector store
+                metadatas = [
+                    {
+                        "chunk_index": chunk_index,
+                        "source": doc_record.filename,
+                        "source_tool": doc_record.source_tool,
+                        **chunk.metadata,
+                        # Points are deduplicated per document, so chunk metadata must not override it
+                        "document_id": doc_record.id
+                    }
+                    for doc_record, chunk_index, chunk in batch
+                ]
+                
+                # Add to vector store
+                vector_ids = await self.vector_store.aadd_vectors(texts, embeddings, metadatas)
+                
+                # Save chunk records; one timestamp per batch instead of a default call per row
+                created_at = datetime.utcnow()
+                bulk_insert(db, DocumentChunk, [
+                    {
+                        "document_id": doc_record.id,
+                        "chunk_index": chunk_index,
+                        "chunk_text": chunk.page_content,
+                        "chunk_hash": chunk.metadata.get("chunk_hash", ""),
+                        "vector_id": vector_id,
+                        "metadata_json": chunk.metadata,
+                        "created_at": created_at
+                    }
+                    for (doc_record, chunk_index, chunk), vector_id in zip(batch, vector_ids)
+                ])
+                
+                chunk_count += len(batch)
+            
+            # Surface chunking or embedding errors from the producer
+            await producer
+            
+        finally:
+            if not producer.done():
+                producer.cancel()
+        
+        return chunk_count
+    
+    def _embed_next_batch(self, doc_chunks: Iterator[Tuple[DocumentModel, int, Document]]
+                          ) -> Optional[Tuple[List[Tuple[DocumentModel, int, Document]], List[str], np.ndarray]]:
+        """Take the next INDEX_BATCH_SIZE chunks and embed them, or None when exhausted
+        
+        Chunks whose content is already in the vector store take the stored
+        vector instead of being embedded again, so every row is a real vector
+        even if that content is deleted before the batch is stored.
+        """
+        batch = list(islice(doc_chunks, INDEX_BATCH_SIZE))
+        if not batch:
+            return None
+        
+        texts = [chunk.page_content for _, _, chunk in batch]
+        stored = self.vector_store.stored_vectors([chunk.metadata.get("chunk_hash") for _, _, chunk in batch])
+        if not stored:
+            return batch, texts, self.embedding_manager.embed_texts(texts)
+        
+        embeddings = np.empty((len(texts), self.embedding_manager.get_embedding_dimension()), dtype=np.float32)
+        embeddings[list(stored)] = list(stored.values())
+        new_indices = [i for i in range(len(texts)) if i not in stored]
+        if new_indices:
+            embeddings[new_indices] = self.embedding_manager.embed_texts([texts[i] for i in new_indices])
+        
+        return batch, texts, embeddings
+    
+    async def ingest_texts(self, texts: Iterable[str], metadatas: Iterable[Dict[str, Any]], 
+                          batch_size: int = INGEST_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """Ingest many texts, sharing document commits and embedding batches
+        
+        texts and metadatas may be lazy iterables (e.g. generators reading
+        from a source tool); only batch_size items are held at a time. Each
+        batch gets its document records in one commit and its chunks embedded
+        and stored together. A failing batch has its stored points deleted
+        and is marked failed, and the error is raised; earlier batches stay
+        indexed.
+        """
+        db = next(get_db())
+        results = []
+        items = zip(texts, metadatas)
+        
+        try:
+            while True:
+                batch = list(islice(items, batch_size))
+                if not batch:
+                    break
+                
+                batch_started = time.monotonic()
+                batch_texts = [text for text, _ in batch]
+                batch_metadatas = [metadata for _, metadata in batch]
+                
+                # Create document records
+                doc_records = [
+                    DocumentModel(
+                        filename=metadata.get("filename", "custom_text"),
+                        source_tool=metadata.get("source_tool", "custom_data"),
+                        content_type="text/plain",
+                        file_size=len(text.encode('utf-8')),
+                        status="processing",
+                        metadata_json=metadata
+                    )
+                    for text, metadata in zip(batch_texts, batch_metadatas)
+                ]
+                db.add_all(doc_records)
+                db.commit()
+                
+                try:
+                    chunk_counts = {doc_record.id: 0 for doc_record in doc_records}
+                    
+                    def doc_chunks() -> Iterator[Tuple[DocumentModel, int, Document]]:
+                        for doc_record, text in zip(doc_records, batch_texts):
+                            document = custom_data_loader.load_from_text(text, doc_record.metadata_json)
+                            chunks = self.text_chunker.iter_chunks(document.page_content, document.metadata)
+                            for i, chunk in enumerate(chunks):
+                                chunk_counts[doc_record.id] += 1
+                                yield doc_record, i, chunk
+                    
+                    await self._index_document_chunks(db, doc_chunks())
+                    
+                    # Update document status
+                    indexed_at = datetime.utcnow()
+                    for doc_record in doc_records:
+                        doc_record.status = "indexed"
+                        doc_record.indexed_at = indexed_at
+                        doc_record.chunk_count = chunk_counts[doc_record.id]
+                    
+                    db.commit()
+                    
+                except Exception as e:
+                    # Drop the batch's unsaved chunk rows and the points already stored
+                    db.rollback()
+                    self.vector_store.delete_document_vectors([doc_record.id for doc_record in doc_records])
+                    
+                    error_message = str(e)
+                    for doc_record in doc_records:
+                        doc_record.status = "failed"
+                        doc_record.error_message = error_message
+                    db.commit()
+                    raise
+                
+                processing_time = time.monotonic() - batch_started
+                results.extend(
+                    {
+                        "document_id": doc_record.id,
+                        "filename": doc_record.filename,
+                        "status": "indexed",
+                        "chunk_count": doc_record.chunk_count,
+                        "processing_time": processing_time
+                    }
+                    for doc_record in doc_records
+                )
+            
+            logger.info("Texts ingested successfully", 
+                       documents=len(results),
+                       chunks=sum(result["chunk_count"] for result in results))
+            
+            return results
+            
+        except Exception as e:
+            logger.error("Failed to ingest texts", 
+                        ingested=len(results),
+                        error=str(e))
+            raise
+        finally:
+            db.close()
+    
     async def query(self, query: str, top_k: int = 5) -> Dict[str, Any]:
         """Query the RAG system and get a response with sources"""
         try:
@@ -315,11 +503,13 @@ class RAGPipeline:
             
             if document_id and document_id not in seen_documents:
                 seen_documents.add(document_id)
+                # Pushed metadata can override these payload fields with any JSON value
+                chunk_index = metadata.get("chunk_index")
                 sources.append({
                     "document_id": document_id,
-                    "filename": metadata.get("source", "Unknown"),
-                    "source_tool": metadata.get("source_tool", "unknown"),
-                    "chunk_index": metadata.get("chunk_index", 0),
+                    "filename": str(metadata.get("source") or "Unknown"),
+                    "source_tool": str(metadata.get("source_tool") or "unknown"),
+                    "chunk_index": chunk_index if isinstance(chunk_index, int) else 0,
                     "relevance_score": result.get("score", 0.0)
                 })
         
@@ -331,18 +521,8 @@ class RAGPipeline:
     
     def _get_content_type(self, file_path: str) -> str:
         """Get content type based on file extension"""
-        extension = Path(file_path).suffix.lower()
-        
-        content_types = {
-            ".pdf": "application/pdf",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ".doc": "application/msword",
-            ".txt": "text/plain",
-            ".md": "text/markdown",
-            ".markdown": "text/markdown"
-        }
-        
-        return content_types.get(extension, "application/octet-stream")
+        extension = os.path.splitext(file_path)[1].lower()
+        return CONTENT_TYPES.get(extension, "application/octet-stream")
     
     def get_document_status(self, document_id: int) -> Optional[Dict[str, Any]]:
         """Get document processing status"""
@@ -377,9 +557,9 @@ class RAGPipeline:
                 DocumentChunk.document_id == document_id
             ).all()
             
-            vector_ids = [chunk.vector_id for chunk in chunk_records]
+            vector_ids = {chunk.vector_id for chunk in chunk_records}
             if vector_ids:
-                self.vector_store.delete_vectors(vector_ids)
+                self.vector_store.delete_vectors(list(vector_ids))
             
             # Delete from database
             db.query(DocumentChunk).filter(DocumentChunk.document_id == document_id).delete()
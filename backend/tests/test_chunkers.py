@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+pytest.importorskip("langchain_text_splitters")
+
+from langchain_text_splitters import CharacterTextSplitter
+
+from app.services.chunkers import CharacterChunker, RecursiveCharacterChunker
+
+PARAGRAPHS = "First paragraph.\n\nSecond one, a bit longer than the first.\n\n\n\nThird.\n\n  \n\nLast"
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit"]
+
+def _corpus(seed: int = 7) -> str:
+    """Build paragraphs of lines of words with varied lengths"""
+    rng = random.Random(seed)
+    line = lambda: " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 60)))
+    return "\n\n".join(
+        "\n".join(line() for _ in range(rng.randint(1, 3)))
+        for _ in range(30)
+    )
+
+CORPUS = _corpus()
+
+RECURSIVE_SIZES = [(80, 0), (200, 0), (200, 40), (500, 100)]
+
+@pytest.mark.parametrize("text, chunk_size, separator", [
+    # Plain paragraphs, including empty and whitespace-only splits
+    (PARAGRAPHS, 40, "\n\n"),
+    (PARAGRAPHS, 1000, "\n\n"),
+    # Empty separator splits into characters
+    ("abc def\nghi", 4, ""),
+    ("", 10, ""),
+    # A single split longer than chunk_size is kept whole
+    ("x" * 50 + "\n\nshort\n\n" + "y" * 30, 20, "\n\n"),
+    ("no separator in this text at all", 5, "\n\n"),
+    # Separators with regex metacharacters and special tokens are matched literally
+    ("a|b|c|dd|eee|f", 3, "|"),
+    ("one.two.three...four", 6, "."),
+    ("doc one<|endoftext|>doc two<|endoftext|><|endoftext|>doc three", 16, "<|endoftext|>"),
+])
+def test_character_fast_path_matches_langchain(text, chunk_size, separator):
+    chunker = CharacterChunker(chunk_size=chunk_size, chunk_overlap=0, separator=separator)
+    splitter = CharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=0, separator=separator)
+    
+    assert chunker.fast_path
+    assert chunker._split_text(text) == splitter.split_text(text)
+
+def test_character_overlap_uses_langchain():
+    chunker = CharacterChunker(chunk_size=40, chunk_overlap=10)
+    splitter = CharacterTextSplitter(chunk_size=40, chunk_overlap=10, separator="\n\n")
+    
+    assert not chunker.fast_path
+    assert chunker._split_text(PARAGRAPHS) == splitter.split_text(PARAGRAPHS)
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", RECURSIVE_SIZES)
+def test_recursive_chunks_fit_chunk_size(chunk_size, chunk_overlap):
+    chunker = RecursiveCharacterChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    
+    pieces = list(chunker._iter_pieces(CORPUS))
+    
+    assert pieces
+    assert all(0 < len(piece) <= chunk_size for piece in pieces)
+    assert all(piece == piece.strip() for piece in pieces)
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", RECURSIVE_SIZES)
+def test_recursive_chunks_cover_text(chunk_size, chunk_overlap):
+    chunker = RecursiveCharacterChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    
+    covered = set()
+    for start, end in chunker._split_offsets(CORPUS):
+        covered.update(range(start, end))
+    
+    assert all(i in covered for i, char in enumerate(CORPUS) if not char.isspace())
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", RECURSIVE_SIZES)
+def test_recursive_overlap(chunk_size, chunk_overlap):
+    chunker = RecursiveCharacterChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    
+    offsets = chunker._split_offsets(CORPUS)
+    overlaps = [
+        previous_end - start
+        for (previous_start, previous_end), (start, _) in zip(offsets, offsets[1:])
+    ]
+    
+    assert all(start > previous_start for (previous_start, _), (start, _) in zip(offsets, offsets[1:]))
+    assert all(overlap <= chunk_overlap for overlap in overlaps)
+    if chunk_overlap:
+        assert any(overlap > 0 for overlap in overlaps)
+    else:
+        assert all(overlap <= 0 for overlap in overlaps)
+
+@pytest.mark.parametrize("text, first_chunk", [
+    # A paragraph break in the second half of the window beats a later word break
+    ("a" * 60 + "\n\n" + "b" * 20 + " " + "c" * 30, "a" * 60),
+    # A line break beats a later word break
+    ("a" * 60 + "\n" + "b" * 20 + " " + "c" * 30, "a" * 60),
+    # A paragraph break early in the window loses to a line break late in it
+    ("a" * 20 + "\n\n" + "b" * 50 + "\n" + "c" * 40, "a" * 20 + "\n\n" + "b" * 50),
+    # Text with no separator is hard cut at chunk_size
+    ("x" * 250, "x" * 100),
+])
+def test_recursive_separator_priority(text, first_chunk):
+    chunker = RecursiveCharacterChunker(chunk_size=100, chunk_overlap=0)
+    
+    assert next(chunker._iter_pieces(text)) == first_chunk
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", RECURSIVE_SIZES)
+def test_recursive_matches_langchain_content(chunk_size, chunk_overlap):
+    chunker = RecursiveCharacterChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    langchain_chunker = RecursiveCharacterChunker(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap, use_langchain=True
+    )
+    
+    pieces = [chunk.page_content for chunk in chunker.iter_chunks(CORPUS)]
+    langchain_pieces = [chunk.page_content for chunk in langchain_chunker.iter_chunks(CORPUS)]
+    
+    # Both split only at separators, so every chunk is verbatim text that fits
+    for chunks in (pieces, langchain_pieces):
+        assert all(0 < len(chunk) <= chunk_size and chunk in CORPUS for chunk in chunks)
+    # Packing differs, but without overlap both keep exactly the text's words in order
+    if not chunk_overlap:
+        assert " ".join(pieces).split() == " ".join(langchain_pieces).split() == CORPUS.split()
@@ -0,0 +1,201 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("numpy")
+pytest.importorskip("qdrant_client")
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints import ingest
+from app.core.database import Base, Document as DocumentModel, DocumentChunk
+from app.services import rag_pipeline as rag_pipeline_module
+from app.services.rag_pipeline import RAGPipeline
+
+def _result(document_id: int) -> dict:
+    """Build one ingest_texts result"""
+    return {
+        "document_id": document_id,
+        "filename": "custom_text",
+        "status": "indexed",
+        "chunk_count": 1,
+        "processing_time": 0.01
+    }
+
+class FakePipeline:
+    """Stands in for rag_pipeline, recording what ingest_texts receives"""
+    
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.calls = []
+    
+    async def ingest_texts(self, texts, metadatas):
+        self.calls.append((list(texts), list(metadatas)))
+        if self.error:
+            raise self.error
+        return [_result(i + 1) for i in range(len(self.calls[-1][0]))]
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(ingest.router)
+    return TestClient(app)
+
+def test_push_batch(client, monkeypatch):
+    pipeline = FakePipeline()
+    monkeypatch.setattr(ingest, "rag_pipeline", pipeline)
+
+    response = client.post("/push/batch", json={"items": [
+        {"source_tool": "notion", "content": "first", "metadata": {"filename": "a.md"}},
+        {"source_tool": "slack", "content": "second one"}
+    ]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert [document["document_id"] for document in body["documents"]] == [1, 2]
+    assert pipeline.calls == [(
+        ["first", "second one"],
+        [
+            {"filename": "a.md", "source_tool": "notion", "content_length": 5},
+            {"source_tool": "slack", "content_length": 10}
+        ]
+    )]
+
+@pytest.mark.parametrize("metadata", [None, {}])
+def test_push_batch_missing_metadata(client, monkeypatch, metadata):
+    pipeline = FakePipeline()
+    monkeypatch.setattr(ingest, "rag_pipeline", pipeline)
+
+    response = client.post("/push/batch", json={"items": [
+        {"source_tool": "notion", "content": "text", "metadata": metadata}
+    ]})
+
+    assert response.status_code == 200
+    assert pipeline.calls[0][1] == [{"source_tool": "notion", "content_length": 4}]
+
+@pytest.mark.parametrize("items", [
+    # No items at all
+    [],
+    # One item with only whitespace content
+    [{"source_tool": "notion", "content": "text"}, {"source_tool": "notion", "content": "  \n"}]
+])
+def test_push_batch_rejects_empty(client, monkeypatch, items):
+    pipeline = FakePipeline()
+    monkeypatch.setattr(ingest, "rag_pipeline", pipeline)
+
+    response = client.post("/push/batch", json={"items": items})
+
+    assert response.status_code == 400
+    assert pipeline.calls == []
+
+def test_push_batch_failure(client, monkeypatch):
+    monkeypatch.setattr(ingest, "rag_pipeline", FakePipeline(RuntimeError("embedding failed")))
+
+    response = client.post("/push/batch", json={"items": [
+        {"source_tool": "notion", "content": "text"}
+    ]})
+
+    assert response.status_code == 500
+    assert "embedding failed" in response.json()["detail"]
+
+class FakeVectorStore:
+    """Stores nothing, optionally failing on the nth add, and records deletions"""
+    
+    def __init__(self, fail_on: int = None):
+        self.fail_on = fail_on
+        self.adds = 0
+        self.deleted = []
+    
+    def stored_vectors(self, hashes):
+        return {}
+    
+    async def aadd_vectors(self, texts, embeddings, metadatas):
+        self.adds += 1
+        if self.adds == self.fail_on:
+            raise RuntimeError("qdrant unavailable")
+        return [f"{metadata['document_id']}-{metadata['chunk_index']}" for metadata in metadatas]
+    
+    def delete_document_vectors(self, document_ids):
+        self.deleted.extend(document_ids)
+        return True
+
+class FakeEmbedder:
+    """Embeds every text as a zero vector"""
+    
+    def embed_texts(self, texts):
+        return np.zeros((len(texts), 4), dtype=np.float32)
+
+@pytest.fixture
+def sessions(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(rag_pipeline_module, "get_db", get_db)
+    return session_factory
+
+def _pipeline(vector_store: FakeVectorStore) -> RAGPipeline:
+    """Build a pipeline with a fake vector store and embedder"""
+    pipeline = RAGPipeline()
+    pipeline.vector_store = vector_store
+    pipeline.embedding_manager = FakeEmbedder()
+    return pipeline
+
+@pytest.mark.asyncio
+async def test_ingest_texts(sessions):
+    vector_store = FakeVectorStore()
+    texts = ["first text", "second text", "third text"]
+
+    results = await _pipeline(vector_store).ingest_texts(
+        texts, [{"source_tool": "notion"}, {}, {"filename": "c.md"}], batch_size=2
+    )
+
+    assert [result["status"] for result in results] == ["indexed"] * 3
+    assert [result["chunk_count"] for result in results] == [1, 1, 1]
+    assert vector_store.adds == 2
+
+    db = sessions()
+    assert [(d.filename, d.source_tool, d.status) for d in db.query(DocumentModel).order_by(DocumentModel.id)] == [
+        ("custom_text", "notion", "indexed"),
+        ("custom_text", "custom_data", "indexed"),
+        ("c.md", "custom_data", "indexed")
+    ]
+    assert db.query(DocumentChunk).count() == 3
+    db.close()
+
+@pytest.mark.asyncio
+async def test_ingest_texts_empty(sessions):
+    vector_store = FakeVectorStore()
+
+    assert await _pipeline(vector_store).ingest_texts([], []) == []
+    assert vector_store.adds == 0
+
+@pytest.mark.asyncio
+async def test_ingest_texts_failed_batch(sessions):
+    vector_store = FakeVectorStore(fail_on=2)
+    texts = ["first text", "second text", "third text", "fourth text"]
+
+    with pytest.raises(RuntimeError, match="qdrant unavailable"):
+        await _pipeline(vector_store).ingest_texts(texts, [{} for _ in texts], batch_size=2)
+
+    db = sessions()
+    documents = db.query(DocumentModel).order_by(DocumentModel.id).all()
+    assert [d.status for d in documents] == ["indexed", "indexed", "failed", "failed"]
+    assert documents[2].error_message == "qdrant unavailable"
+
+    # The failed batch keeps no chunk rows and its points are deleted
+    assert {chunk.document_id for chunk in db.query(DocumentChunk)} == {documents[0].id, documents[1].id}
+    assert vector_store.deleted == [documents[2].id, documents[3].id]
+    db.close()